@@ -1,11 +1,19 @@
 import heapq  # Import the heapq module for priority queue (min-heap)
-
-N, M = 5, 5  # Define the size of the maze (5 rows and 5 columns)
+import mmap  # Memory-mapped files for shared precomputed tables
+import sys  # Optional maze file on the command line
+import time  # Wall-clock timing for search statistics
+from array import array  # Compact typed arrays for the large-grid engine
+from collections import OrderedDict  # Recency order for the path cache
+from multiprocessing import Pool, shared_memory  # Worker pool and shared maze for batch queries
 
 # Moves: Down, Left, Up, Right (coordinate changes)
 row_moves = [1, 0, -1, 0]
 col_moves = [0, -1, 0, 1]
 
+# Diagonal moves for 8-connected terrain: Down-Left, Down-Right, Up-Left, Up-Right (directions 4 to 7)
+diagonal_row_moves = [1, 1, -1, -1]
+diagonal_col_moves = [-1, 1, -1, 1]
+
 # Node class represents a position in the maze with additional information
 class Node:
     def __init__(self, x, y, level, cost, parent):
@@ -19,8 +27,9 @@ class Node:
         return self.cost < other.cost  # Min-heap priority based on 'cost'
 
 # Check if a given position is within bounds and not a wall ('#')
+# The maze size is taken from the maze itself, so any rectangular list of rows works.
 def is_safe(x, y, maze):
-    return 0 <= x < N and 0 <= y < M and maze[x][y] != '#'
+    return 0 <= x < len(maze) and 0 <= y < len(maze[0]) and maze[x][y] != '#'
 
 # Calculate the heuristic (Manhattan distance) between the current node and the goal node
 def heuristic(x, y, goal_x, goal_y):
@@ -28,15 +37,14 @@ def heuristic(x, y, goal_x, goal_y):
 
 # Find the position of a specific character (start 'S' or goal 'G') in the maze
 def find_position(maze, char):
-    for i in range(N):
-        for j in range(M):
-            if maze[i][j] == char:  # If the character matches, return the position (i, j)
-                return i, j  # Return (row, column)
+    for i, row in enumerate(maze):
+        if char in row:  # Let the row's own membership test do the scan
+            return i, row.index(char)  # Return (row, column)
 
 # Function to print the maze with visited and path nodes highlighted
 def print_maze(maze, visited=None, path=None):
-    for i in range(N):
-        for j in range(M):
+    for i in range(len(maze)):
+        for j in range(len(maze[i])):
             if path and (i, j) in path:
                 print('P', end=' ')  # Mark the path nodes as 'P'
             elif visited and (i, j) in visited:
@@ -55,8 +63,50 @@ def print_solution(node, maze):
     print("Final Path:")
     print_maze(maze, path=path)  # Print the maze with the path highlighted
 
+# Counters collected during one search, so search cost can be watched without rendering anything
+class SearchStats:
+    def __init__(self):
+        self.nodes_expanded = 0  # Nodes popped from the heap and expanded
+        self.heap_pushes = 0  # Entries pushed onto the heap (including the start)
+        self.stale_pops = 0  # Popped entries skipped because their cell was already expanded
+        self.peak_open = 0  # Largest size the open list (heap) reached
+        self.wall_time = 0.0  # Seconds spent inside the search
+
+    def __repr__(self):
+        return (f"SearchStats(expanded={self.nodes_expanded}, pushes={self.heap_pushes}, "
+                f"stale={self.stale_pops}, peak_open={self.peak_open}, time={self.wall_time:.4f}s)")
+
+# Observer that reproduces the classic step-by-step output (one full maze print per expansion)
+# Any callable observer(x, y, level) can be passed to the solvers instead to visualise the search.
+class MazePrinter:
+    def __init__(self, maze):
+        self.maze = maze
+        self.visited = set()  # Cells seen so far, only needed for drawing
+
+    def __call__(self, x, y, level):
+        self.visited.add((x, y))
+        print(f"Step {level}: Visited ({x}, {y})")
+        print_maze(self.maze, visited=self.visited)  # Print visited nodes step by step
+
+# Collect the path from the start to the given node as a list of (x, y)
+def node_path(node):
+    path = []
+    while node:
+        path.append((node.x, node.y))
+        node = node.parent
+    path.reverse()
+    return path
+
 # The main function that solves the maze using A* algorithm
-def solve_maze(maze):
+# verbose=False is the quiet mode: nothing is printed and print_maze is never called.
+# observer is called as observer(x, y, level) on every expansion (defaults to MazePrinter when verbose).
+# Returns (path, stats) where path is a list of (x, y) or None when there is no solution.
+def solve_maze(maze, verbose=True, observer=None):
+    stats = SearchStats()
+    started = time.perf_counter()
+    if verbose and observer is None:
+        observer = MazePrinter(maze)
+
     # Find the start and goal positions in the maze
     start_x, start_y = find_position(maze, 'S')
     goal_x, goal_y = find_position(maze, 'G')
@@ -67,22 +117,31 @@ def solve_maze(maze):
     # Create the root node (start node) and push it into the priority queue
     root = Node(start_x, start_y, 0, heuristic(start_x, start_y, goal_x, goal_y), None)
     heapq.heappush(priority_queue, root)  # Push the start node into the priority queue
+    stats.heap_pushes = stats.peak_open = 1
 
     # Main loop that runs until we find the solution or exhaust all nodes
     while priority_queue:
         # Pop the node with the lowest cost (f(n) = g(n) + h(n))
         min_node = heapq.heappop(priority_queue)
-        
-        # Mark the current node as visited and print the maze with visited nodes
+
+        # A cheaper copy of this position was already expanded, so this entry is stale
+        if (min_node.x, min_node.y) in visited:
+            stats.stale_pops += 1
+            continue
+
+        # Mark the current node as visited and report the step to the observer
         visited.add((min_node.x, min_node.y))
-        print(f"Step {min_node.level}: Visited ({min_node.x}, {min_node.y})")
-        print_maze(maze, visited=visited)  # Print visited nodes step by step
+        stats.nodes_expanded += 1
+        if observer is not None:
+            observer(min_node.x, min_node.y, min_node.level)
 
         # If we have reached the goal, print the solution and exit
         if (min_node.x, min_node.y) == (goal_x, goal_y):
-            print("Solution Found!")
-            print_solution(min_node, maze)  # Print the final path
-            return  # Exit the function since the solution is found
+            stats.wall_time = time.perf_counter() - started
+            if verbose:
+                print("Solution Found!")
+                print_solution(min_node, maze)  # Print the final path
+            return node_path(min_node), stats  # Exit the function since the solution is found
 
         # Explore the neighbors (4 possible directions: down, left, up, right)
         for i in range(4):
@@ -91,9 +150,1072 @@ def solve_maze(maze):
                 # If the new position is safe and not visited, create a new child node
                 child = Node(new_x, new_y, min_node.level + 1, min_node.level + 1 + heuristic(new_x, new_y, goal_x, goal_y), min_node)
                 heapq.heappush(priority_queue, child)  # Add the child node to the priority queue
+                stats.heap_pushes += 1
+        stats.peak_open = max(stats.peak_open, len(priority_queue))
 
     # If we exhaust the queue and don't find the goal, print "No solution found."
-    print("No solution found.")
+    stats.wall_time = time.perf_counter() - started
+    if verbose:
+        print("No solution found.")
+    return None, stats
+
+#<------------------------------------------------------------------------------
+
+# Compact engine for large grids
+# The Node version above allocates one object per push and hashes (x, y) tuples for the visited set.
+# On multi-million-cell grids that churn dominates, so this engine keeps the maze as one flat byte
+# buffer and all search state in preallocated arrays indexed by the cell number (row * stride + col).
+
+WALL = ord('#')  # Byte value of a wall cell in the flat buffer
+NO_PARENT = 255  # Marker in the parent-direction array for cells that were never reached
+
+# A maze stored as one flat byte buffer (one byte per cell, the original characters)
+class CompactMaze:
+    def __init__(self, cells, rows, cols, stride, start, goal):
+        self.cells = cells  # Flat bytes-like buffer; a cell is blocked when its byte is WALL
+        self.rows, self.cols = rows, cols  # Grid dimensions
+        self.stride = stride  # Distance in bytes between two rows (cols, or more if rows are padded)
+        self.start, self.goal = start, goal  # Cell indices of 'S' and 'G' (-1 when missing)
+        self.version = 0  # Bumped on every edit, so cached results for older versions are never served
+
+    # Change one cell (e.g. to WALL or ord('.')) and bump the maze version
+    def set_cell(self, x, y, value):
+        self.cells[x * self.stride + y] = value
+        self.version += 1
+
+    def index(self, x, y):
+        return x * self.stride + y  # Convert (row, column) into a flat cell index
+
+    def position(self, cell):
+        return divmod(cell, self.stride)  # Convert a flat cell index back into (row, column)
+
+# Convert a list-of-lists maze into a CompactMaze
+def compact_maze(maze):
+    rows, cols = len(maze), len(maze[0])
+    cells = bytearray(''.join(''.join(row) for row in maze), 'ascii')  # Row-major flat copy of the maze
+    start, goal = cells.find(b'S'), cells.find(b'G')  # Locate start and goal with a C-level scan
+    return CompactMaze(cells, rows, cols, cols, start, goal)
+
+# Walk the parent-direction array back from the goal and return the path as a list of (x, y)
+def rebuild_path(grid, parent_dir, goal):
+    moves = zip(row_moves + diagonal_row_moves, col_moves + diagonal_col_moves)
+    step = [grid.stride * dx + dy for dx, dy in moves]  # Flat offset of each move (diagonals are 4 to 7)
+    path = []
+    cell = goal
+    while True:
+        path.append(grid.position(cell))
+        d = parent_dir[cell]
+        if d == NO_PARENT:  # Only the start has no parent
+            break
+        cell -= step[d]  # Undo the move that reached this cell
+    path.reverse()
+    return path
+
+# A* over a CompactMaze using integer cell indices on the heap
+# Memory per cell: 1 byte for the maze, 4 bytes for g(n) and 1 byte for the direction we arrived from.
+# observer(x, y, level) is called on every expansion; pass a SearchStats as stats to collect counters.
+# mode selects the search: 'astar' (every cell) or 'jps' (Jump Point Search).
+# heuristic(cell, goal) replaces the Manhattan distance when given (e.g. LandmarkIndex.lower_bound);
+# it must never overestimate and must be consistent, like the Manhattan distance itself.
+# Returns the path from start to goal as a list of (x, y), or None when the goal is unreachable.
+def solve_maze_compact(grid, start=None, goal=None, observer=None, stats=None, mode='astar', heuristic=None):
+    if mode == 'jps':
+        return solve_maze_jps(grid, start, goal, observer, stats, heuristic)
+    if mode != 'astar':
+        raise ValueError(f"Unknown search mode: {mode}")
+    started = time.perf_counter()
+    start = grid.start if start is None else start
+    goal = grid.goal if goal is None else goal
+    cells, rows, cols, stride = grid.cells, grid.rows, grid.cols, grid.stride
+    size = rows * stride  # Number of slots in the flat arrays (also used to pack f and cell into one int)
+    goal_x, goal_y = divmod(goal, stride)
+
+    g = array('i', [-1]) * size  # g(n) for every cell, -1 means "not reached yet"
+    parent_dir = bytearray([NO_PARENT]) * size  # Index into row_moves/col_moves used to reach each cell
+
+    # Heap entries are single ints (f * size + h) * size + cell, so the heap never compares tuples or
+    # objects. Among equal f the smaller h (the deeper node) comes first, which sends the search straight
+    # on towards the goal instead of widening the front of equally good cells. h < size always holds.
+    sx, sy = divmod(start, stride)
+    g[start] = 0
+    h = heuristic(start, goal) if heuristic else abs(sx - goal_x) + abs(sy - goal_y)
+    priority_queue = [(h * size + h) * size + start]
+    expanded, pushes, stale, peak = 0, 1, 0, 1  # Counters are kept in locals and copied to stats at the end
+    path = None
+
+    while priority_queue:
+        rest, cell = divmod(heapq.heappop(priority_queue), size)
+        f = rest // size
+        x, y = divmod(cell, stride)
+        level = g[cell]
+        h = heuristic(cell, goal) if heuristic else abs(x - goal_x) + abs(y - goal_y)
+        if f != level + h:  # A cheaper copy of this cell was already expanded
+            stale += 1
+            continue
+        expanded += 1
+        if observer is not None:
+            observer(x, y, level)
+        if cell == goal:
+            path = rebuild_path(grid, parent_dir, goal)
+            break
+
+        # Explore the neighbours in the same order as the Node version: down, left, up, right
+        level += 1
+        for i in range(4):
+            new_x, new_y = x + row_moves[i], y + col_moves[i]
+            if 0 <= new_x < rows and 0 <= new_y < cols:
+                child = new_x * stride + new_y
+                if cells[child] != WALL and (g[child] < 0 or level < g[child]):
+                    g[child] = level
+                    parent_dir[child] = i
+                    h = heuristic(child, goal) if heuristic else abs(new_x - goal_x) + abs(new_y - goal_y)
+                    heapq.heappush(priority_queue, ((level + h) * size + h) * size + child)
+                    pushes += 1
+        if len(priority_queue) > peak:
+            peak = len(priority_queue)
+
+    if stats is not None:
+        stats.nodes_expanded, stats.heap_pushes, stats.stale_pops, stats.peak_open = expanded, pushes, stale, peak
+        stats.wall_time = time.perf_counter() - started
+    return path  # None when the goal cannot be reached from the start
+
+#<------------------------------------------------------------------------------
+
+# Jump Point Search (JPS) for uniform-cost 4-connected grids
+# On open grids plain A* pushes many symmetric paths of equal length. JPS only keeps one canonical
+# path of every length: horizontal moves may turn vertical anywhere, but a vertical move may only
+# turn horizontal at a "forced" cell, where the same turn one cell earlier is blocked by a wall.
+# Straight runs without such choices are skipped ("jumped"), so only jump points reach the heap.
+
+# Check that (x, y) is inside the grid and not a wall
+def is_free(grid, x, y):
+    return 0 <= x < grid.rows and 0 <= y < grid.cols and grid.cells[x * grid.stride + y] != WALL
+
+# Jump vertically from (x, y) by dx (+1 down, -1 up); returns the jump point cell or -1 for a dead end
+def jump_vertical(grid, x, y, dx, goal):
+    cells, rows, cols, stride = grid.cells, grid.rows, grid.cols, grid.stride
+    has_left, has_right = y > 0, y < cols - 1  # Whether the side columns exist at all
+    cell = x * stride + y
+    step = dx * stride
+    while True:
+        x += dx
+        if not 0 <= x < rows:
+            return -1
+        prev, cell = cell, cell + step
+        if cells[cell] == WALL:
+            return -1
+        if cell == goal:
+            return cell
+        # Forced turn: a side is open here but was blocked on the previous cell
+        if (has_left and cells[cell - 1] != WALL and cells[prev - 1] == WALL) or \
+           (has_right and cells[cell + 1] != WALL and cells[prev + 1] == WALL):
+            return cell
+
+# Jump horizontally from (x, y) by dy (+1 right, -1 left); returns the jump point cell or -1 for a dead end
+# A horizontal cell is a jump point when a vertical jump from it finds one (or it is the goal).
+def jump_horizontal(grid, x, y, dy, goal):
+    cells, cols = grid.cells, grid.cols
+    cell = x * grid.stride + y
+    while True:
+        y += dy
+        cell += dy
+        if not 0 <= y < cols or cells[cell] == WALL:
+            return -1
+        if cell == goal:
+            return cell
+        if jump_vertical(grid, x, y, 1, goal) >= 0 or jump_vertical(grid, x, y, -1, goal) >= 0:
+            return cell
+
+# Directions (indices into row_moves/col_moves) to continue in after arriving at a cell in direction d
+def jps_directions(grid, x, y, d):
+    if d == 1 or d == 3:  # Horizontal arrival: keep going, or turn up/down
+        return (d, 0, 2)
+    prev_x = x - row_moves[d]  # Vertical arrival: keep going, plus any forced horizontal turn
+    dirs = [d]
+    for side in (1, 3):
+        side_y = y + col_moves[side]
+        if is_free(grid, x, side_y) and not is_free(grid, prev_x, side_y):
+            dirs.append(side)
+    return dirs
+
+# A* over jump points only; same arguments (except mode) and result as solve_maze_compact
+# Every jump point stores a bitmask of the directions it was reached from (with its best g), so
+# two equally short arrivals from different directions both keep their canonical successors.
+def solve_maze_jps(grid, start=None, goal=None, observer=None, stats=None, heuristic=None):
+    started = time.perf_counter()
+    start = grid.start if start is None else start
+    goal = grid.goal if goal is None else goal
+    stride = grid.stride
+    size = grid.rows * stride
+    goal_x, goal_y = divmod(goal, stride)
+
+    g = array('i', [-1]) * size  # g(n) of every jump point
+    parent = array('i', [-1]) * size  # Previous jump point on the best path (always in a straight line)
+    arrived = bytearray(size)  # Bitmask of directions a cell was reached from with its current g
+    expanded_dirs = bytearray(size)  # Bitmask of arrival directions already expanded
+
+    sx, sy = divmod(start, stride)
+    g[start] = 0
+    arrived[start] = 0x10  # Special bit for the start: expand all four directions
+    h = heuristic(start, goal) if heuristic else abs(sx - goal_x) + abs(sy - goal_y)
+    priority_queue = [(h * size + h) * size + start]  # Same keys as solve_maze_compact: f, then h, then cell
+    expanded, pushes, stale, peak = 0, 1, 0, 1
+    path = None
+
+    while priority_queue:
+        cell = heapq.heappop(priority_queue) % size
+        todo = arrived[cell] & ~expanded_dirs[cell]  # Arrival directions not expanded yet
+        if not todo:
+            stale += 1
+            continue
+        expanded_dirs[cell] |= todo
+        x, y = divmod(cell, stride)
+        level = g[cell]
+        expanded += 1
+        if observer is not None:
+            observer(x, y, level)
+        if cell == goal:
+            path = rebuild_jump_path(grid, parent, goal)
+            break
+
+        # Collect the directions to jump in from every new arrival direction
+        if todo & 0x10:
+            directions = range(4)
+        else:
+            directions = set()
+            for d in range(4):
+                if todo & (1 << d):
+                    directions.update(jps_directions(grid, x, y, d))
+
+        for d in directions:
+            if d == 0 or d == 2:
+                jump = jump_vertical(grid, x, y, row_moves[d], goal)
+            else:
+                jump = jump_horizontal(grid, x, y, col_moves[d], goal)
+            if jump < 0:
+                continue
+            jx, jy = divmod(jump, stride)
+            new_level = level + abs(jx - x) + abs(jy - y)  # Straight segment, so its length is the cost
+            bit = 1 << d
+            if g[jump] < 0 or new_level < g[jump]:
+                g[jump] = new_level
+                parent[jump] = cell
+                arrived[jump] = bit
+                expanded_dirs[jump] = 0
+            elif new_level == g[jump] and not arrived[jump] & bit:
+                arrived[jump] |= bit  # Equally short arrival from another direction
+            else:
+                continue
+            h = heuristic(jump, goal) if heuristic else abs(jx - goal_x) + abs(jy - goal_y)
+            heapq.heappush(priority_queue, ((new_level + h) * size + h) * size + jump)
+            pushes += 1
+        if len(priority_queue) > peak:
+            peak = len(priority_queue)
+
+    if stats is not None:
+        stats.nodes_expanded, stats.heap_pushes, stats.stale_pops, stats.peak_open = expanded, pushes, stale, peak
+        stats.wall_time = time.perf_counter() - started
+    return path
+
+# Rebuild the full cell-by-cell path by filling in the straight segments between jump points
+def rebuild_jump_path(grid, parent, goal):
+    points = []
+    cell = goal
+    while cell >= 0:
+        points.append(grid.position(cell))
+        cell = parent[cell]
+    points.reverse()
+    path = [points[0]]
+    for x, y in points[1:]:
+        px, py = path[-1]
+        dx, dy = (x > px) - (x < px), (y > py) - (y < py)  # Unit step along the segment
+        while (px, py) != (x, y):
+            px, py = px + dx, py + dy
+            path.append((px, py))
+    return path
+
+#<------------------------------------------------------------------------------
+
+# Landmark (ALT) heuristic for repeated queries on the same maze
+# Exact BFS distances from K landmark cells give a lower bound through the triangle inequality:
+# dist(n, goal) >= |dist(L, goal) - dist(L, n)| for every landmark L. Around walls this is much
+# tighter than the Manhattan distance, and the tables are built once and shared by every query.
+
+ALT_MAGIC = b'ALT1'  # File signature of a saved landmark index
+ALT_HEADER = 4 + 4 * 4  # Magic plus landmark count, rows, cols and stride as int32
+
+# Breadth-first distances from source to every cell (-1 for walls and unreachable cells)
+def bfs_distances(grid, source):
+    cells, rows, cols, stride = grid.cells, grid.rows, grid.cols, grid.stride
+    dist = array('i', [-1]) * (rows * stride)
+    queue = array('i', [0]) * (rows * stride)  # Preallocated FIFO, every cell enters at most once
+    dist[source] = 0
+    queue[0] = source
+    head, tail = 0, 1
+    while head < tail:
+        cell = queue[head]
+        head += 1
+        x, y = divmod(cell, stride)
+        level = dist[cell] + 1
+        for i in range(4):
+            new_x, new_y = x + row_moves[i], y + col_moves[i]
+            if 0 <= new_x < rows and 0 <= new_y < cols:
+                child = new_x * stride + new_y
+                if dist[child] < 0 and cells[child] != WALL:
+                    dist[child] = level
+                    queue[tail] = child
+                    tail += 1
+    return dist
+
+# Precomputed landmark distance tables, stored as one flat int32 array (landmark-major)
+class LandmarkIndex:
+    def __init__(self, landmarks, distances, rows, cols, stride, mapping=None):
+        self.landmarks = list(landmarks)  # Cell index of every landmark
+        self.distances = distances  # Flat int32 array: distances[k * size + cell]
+        self.rows, self.cols, self.stride = rows, cols, stride
+        self.size = rows * stride
+        self.offsets = [k * self.size for k in range(len(self.landmarks))]  # Start of each landmark table
+        self.mapping = mapping  # Keeps the memory map alive when the index was loaded from a file
+
+    # Pick k landmarks by farthest-point selection and run one BFS from each of them
+    @classmethod
+    def build(cls, grid, k=8):
+        first = grid.start if grid.start >= 0 else next(i for i, c in enumerate(grid.cells) if c != WALL)
+        nearest = bfs_distances(grid, first)  # Distance from every cell to the closest chosen landmark
+        landmarks, tables = [], array('i')
+        for _ in range(k):
+            # The next landmark is the reachable cell farthest from all landmarks chosen so far
+            candidate = max(range(len(nearest)), key=nearest.__getitem__)
+            if nearest[candidate] <= 0:
+                break  # Every reachable cell is already a landmark
+            dist = bfs_distances(grid, candidate)
+            landmarks.append(candidate)
+            tables.extend(dist)
+            for cell in range(len(nearest)):
+                if 0 <= dist[cell] < nearest[cell]:
+                    nearest[cell] = dist[cell]
+        return cls(landmarks, tables, grid.rows, grid.cols, grid.stride)
+
+    # Admissible and consistent lower bound on the path length from cell to goal
+    def lower_bound(self, cell, goal):
+        distances = self.distances
+        x, y = divmod(cell, self.stride)
+        goal_x, goal_y = divmod(goal, self.stride)
+        best = abs(x - goal_x) + abs(y - goal_y)  # Never weaker than the Manhattan distance
+        for base in self.offsets:
+            a, b = distances[base + cell], distances[base + goal]
+            if a >= 0 and b >= 0 and abs(a - b) > best:
+                best = abs(a - b)
+        return best
+
+    # Write the index as a small header followed by the raw int32 landmarks and tables
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(ALT_MAGIC)
+            array('i', [len(self.landmarks), self.rows, self.cols, self.stride]).tofile(f)
+            array('i', self.landmarks).tofile(f)
+            array('i', self.distances).tofile(f)
+
+    # Memory-map a saved index; the tables are used in place, so processes share the same pages
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if mapping[:4] != ALT_MAGIC:
+            raise ValueError(f"{path} is not a landmark index")
+        view = memoryview(mapping)
+        k, rows, cols, stride = view[4:ALT_HEADER].cast('i')
+        landmarks = view[ALT_HEADER:ALT_HEADER + 4 * k].cast('i')
+        distances = view[ALT_HEADER + 4 * k:].cast('i')
+        if len(distances) != k * rows * stride:
+            raise ValueError(f"{path} is truncated")
+        return cls(landmarks, distances, rows, cols, stride, mapping)
+
+#<------------------------------------------------------------------------------
+
+# Incremental replanning with D* Lite
+# When a few cells toggle between wall and floor, searching again from scratch re-expands nearly the
+# whole grid. D* Lite searches backwards from the goal and keeps g(n) and rhs(n) (a one-step lookahead
+# of g) for every cell between calls; a change only re-opens the cells whose distance it affects.
+
+INFINITY = 1 << 30  # Distance of cells that cannot reach the goal
+
+class IncrementalPlanner:
+    def __init__(self, grid, start=None, goal=None):
+        self.grid = grid  # CompactMaze whose cells are edited in place (the buffer must be writable)
+        self.start = grid.start if start is None else start
+        self.goal = grid.goal if goal is None else goal
+        self.last_start = self.start  # Start position when the key modifier was last updated
+        self.key_modifier = 0  # km: grows by h(last_start, start) as the agent moves
+        size = grid.rows * grid.stride
+        self.g = array('i', [INFINITY]) * size
+        self.rhs = array('i', [INFINITY]) * size
+        self.open = {}  # Cell -> current key; heap entries whose key differs are stale
+        self.queue = []
+        self.expanded = 0  # Cells expanded by the last replan
+        self.rhs[self.goal] = 0
+        self.push(self.goal)
+
+    # Manhattan distance from the agent to a cell (the search runs from the goal towards the agent)
+    def h(self, cell):
+        x, y = self.grid.position(cell)
+        sx, sy = self.grid.position(self.start)
+        return heuristic(sx, sy, x, y)
+
+    def key(self, cell):
+        best = min(self.g[cell], self.rhs[cell])
+        return (best + self.h(cell) + self.key_modifier, best)
+
+    def push(self, cell):
+        key = self.key(cell)
+        self.open[cell] = key
+        heapq.heappush(self.queue, (key[0], key[1], cell))
+
+    # Free neighbours of a cell (every move is reversible, so these are successors and predecessors)
+    def neighbours(self, cell):
+        grid = self.grid
+        x, y = grid.position(cell)
+        for i in range(4):
+            new_x, new_y = x + row_moves[i], y + col_moves[i]
+            if 0 <= new_x < grid.rows and 0 <= new_y < grid.cols and grid.cells[new_x * grid.stride + new_y] != WALL:
+                yield new_x * grid.stride + new_y
+
+    # Recompute rhs(cell) from its neighbours and (re)queue the cell if it became inconsistent
+    def update_vertex(self, cell):
+        if cell != self.goal:
+            best = INFINITY
+            if self.grid.cells[cell] != WALL:
+                for child in self.neighbours(cell):
+                    if self.g[child] + 1 < best:
+                        best = self.g[child] + 1
+            self.rhs[cell] = best
+        if self.g[cell] != self.rhs[cell]:
+            self.push(cell)
+        else:
+            self.open.pop(cell, None)
+
+    def compute_shortest_path(self):
+        g, rhs, open_keys, queue = self.g, self.rhs, self.open, self.queue
+        start = self.start
+        while queue:
+            k1, k2, cell = queue[0]
+            if open_keys.get(cell) != (k1, k2):  # Outdated heap entry
+                heapq.heappop(queue)
+                continue
+            if (k1, k2) >= self.key(start) and rhs[start] == g[start]:
+                break
+            heapq.heappop(queue)
+            self.expanded += 1
+            new_key = self.key(cell)
+            if (k1, k2) < new_key:  # The key grew since it was queued (the agent moved)
+                self.push(cell)
+            elif g[cell] > rhs[cell]:  # Overconsistent: the distance improved, settle it
+                g[cell] = rhs[cell]
+                del open_keys[cell]
+                for parent in self.neighbours(cell):
+                    self.update_vertex(parent)
+            else:  # Underconsistent: the old distance is no longer valid
+                g[cell] = INFINITY
+                self.update_vertex(cell)
+                for parent in self.neighbours(cell):
+                    self.update_vertex(parent)
+
+    # Fold the agent's movement into km before any edge costs change (D* Lite key modifier)
+    def note_change(self):
+        if self.last_start != self.start:
+            x, y = self.grid.position(self.last_start)
+            sx, sy = self.grid.position(self.start)
+            self.key_modifier += heuristic(x, y, sx, sy)
+            self.last_start = self.start
+
+    # Turn a cell into a wall and update the cells around it
+    def set_wall(self, x, y):
+        cell = self.grid.index(x, y)
+        if self.grid.cells[cell] == WALL:
+            return
+        self.note_change()
+        self.grid.set_cell(x, y, WALL)
+        self.update_vertex(cell)
+        for parent in self.neighbours(cell):
+            self.update_vertex(parent)
+
+    # Turn a wall back into an empty cell and update the cells around it
+    def clear_wall(self, x, y):
+        cell = self.grid.index(x, y)
+        if self.grid.cells[cell] != WALL:
+            return
+        self.note_change()
+        self.grid.set_cell(x, y, ord('.'))
+        self.update_vertex(cell)
+        for parent in self.neighbours(cell):
+            self.update_vertex(parent)
+
+    # The agent has moved to (x, y) along its route
+    def move_to(self, x, y):
+        self.start = self.grid.index(x, y)
+
+    # Bring g/rhs up to date and return the path from the agent to the goal (or None)
+    def replan(self):
+        self.expanded = 0
+        self.note_change()
+        self.compute_shortest_path()
+        if self.g[self.start] >= INFINITY:
+            return None
+        path = [self.grid.position(self.start)]
+        cell = self.start
+        while cell != self.goal:
+            cell = min(self.neighbours(cell), key=self.g.__getitem__)  # Step to the neighbour closest to the goal
+            path.append(self.grid.position(cell))
+        return path
+
+#<------------------------------------------------------------------------------
+
+# Hierarchical path-finding (HPA*)
+# The grid is cut into square clusters. Entrances are placed on the free cells shared by two
+# neighbouring clusters, and the distances between the entrances of a cluster are found once (one
+# BFS per entrance over a copy of the cluster). A query searches the small abstract graph of
+# entrances with A*, then refines only the segments on the answer with the compact A* core; those
+# intra-cluster paths are cached until a wall change rebuilds their cluster. Paths are near-optimal.
+
+class HierarchicalMaze:
+    def __init__(self, grid, cluster_size=16):
+        self.grid = grid  # CompactMaze; set_wall/clear_wall edit its cells in place
+        self.size = cluster_size
+        self.cluster_rows = (grid.rows + cluster_size - 1) // cluster_size
+        self.cluster_cols = (grid.cols + cluster_size - 1) // cluster_size
+        self.borders = {}  # (cluster, neighbour cluster) -> list of (cell, cell across the border)
+        self.links = {}  # cluster -> {entrance cell: [cells across the border]}
+        self.edges = {}  # cluster -> {entrance cell: [(other entrance, cost)]}
+        self.segments = {}  # cluster -> {(entrance, entrance): cached path as a list of (x, y)}
+        for k in range(self.cluster_rows * self.cluster_cols):
+            for other in self.neighbour_clusters(k):
+                if k < other:
+                    self.build_border(k, other)
+        for k in range(self.cluster_rows * self.cluster_cols):
+            self.build_cluster(k)
+
+    def cluster_of(self, cell):
+        x, y = self.grid.position(cell)
+        return (x // self.size) * self.cluster_cols + y // self.size
+
+    # Top-left corner and height/width of a cluster (clusters on the last row/column may be smaller)
+    def cluster_bounds(self, k):
+        x0, y0 = (k // self.cluster_cols) * self.size, (k % self.cluster_cols) * self.size
+        return x0, y0, min(self.size, self.grid.rows - x0), min(self.size, self.grid.cols - y0)
+
+    def neighbour_clusters(self, k):
+        cx, cy = divmod(k, self.cluster_cols)
+        for i in range(4):
+            nx, ny = cx + row_moves[i], cy + col_moves[i]
+            if 0 <= nx < self.cluster_rows and 0 <= ny < self.cluster_cols:
+                yield nx * self.cluster_cols + ny
+
+    # Find the entrances on the border between clusters a < b (b is to the right of or below a)
+    # Every run of cells that is free on both sides gets one transition in its middle, or one at
+    # each end when the run is long, as in the original HPA* paper.
+    def build_border(self, a, b):
+        grid = self.grid
+        ax, ay, ah, aw = self.cluster_bounds(a)
+        if a // self.cluster_cols == b // self.cluster_cols:  # Same cluster row: last column of a against first column of b
+            pairs = [(grid.index(x, ay + aw - 1), grid.index(x, ay + aw)) for x in range(ax, ax + ah)]
+        else:  # Horizontal border: last row of a against first row of b
+            pairs = [(grid.index(ax + ah - 1, y), grid.index(ax + ah, y)) for y in range(ay, ay + aw)]
+        transitions, run = [], []
+        for pair in pairs + [None]:  # The None sentinel closes the last run
+            if pair is not None and grid.cells[pair[0]] != WALL and grid.cells[pair[1]] != WALL:
+                run.append(pair)
+                continue
+            if len(run) >= 6:
+                transitions += [run[0], run[-1]]
+            elif run:
+                transitions.append(run[len(run) // 2])
+            run = []
+        self.borders[(a, b)] = transitions
+
+    # Copy one cluster into a small CompactMaze so the A* core runs on cluster-sized arrays
+    def cluster_maze(self, k):
+        grid = self.grid
+        x0, y0, height, width = self.cluster_bounds(k)
+        cells = bytearray()
+        for x in range(x0, x0 + height):
+            row = x * grid.stride + y0
+            cells += grid.cells[row:row + width]
+        return CompactMaze(cells, height, width, width, -1, -1), x0, y0
+
+    # Shortest path between two cells of the same cluster, as global (x, y) positions, or None
+    def local_path(self, local, x0, y0, a, b):
+        ax, ay = self.grid.position(a)
+        bx, by = self.grid.position(b)
+        path = solve_maze_compact(local, local.index(ax - x0, ay - y0), local.index(bx - x0, by - y0))
+        return None if path is None else [(x + x0, y + y0) for x, y in path]
+
+    # Distances inside one cluster from cell to every target, from a single BFS over the cluster copy
+    def local_costs(self, local, x0, y0, cell, targets):
+        x, y = self.grid.position(cell)
+        dist = bfs_distances(local, local.index(x - x0, y - y0))
+        costs = []
+        for target in targets:
+            tx, ty = self.grid.position(target)
+            d = dist[local.index(tx - x0, ty - y0)]
+            if d >= 0:
+                costs.append((target, d))
+        return costs
+
+    # Collect the entrances of cluster k and their distances to each other; drops its cached paths
+    def build_cluster(self, k):
+        links = {}
+        for other in self.neighbour_clusters(k):
+            for a, b in self.borders[(min(k, other), max(k, other))]:
+                mine, across = (a, b) if k < other else (b, a)
+                links.setdefault(mine, []).append(across)
+        local, x0, y0 = self.cluster_maze(k)
+        self.edges[k] = {e: self.local_costs(local, x0, y0, e, [o for o in links if o != e]) for e in links}
+        self.links[k] = links
+        self.segments[k] = {}
+
+    # Refine one abstract edge inside cluster k into cells; entrance-to-entrance paths are cached
+    def segment(self, k, a, b, cache=True):
+        cached = self.segments[k]
+        if (a, b) in cached:
+            return cached[(a, b)]
+        if (b, a) in cached:
+            return cached[(b, a)][::-1]
+        local, x0, y0 = self.cluster_maze(k)
+        path = self.local_path(local, x0, y0, a, b)
+        if cache:
+            cached[(a, b)] = path
+        return path
+
+    # Answer a query on the abstract graph and refine it into a full list of (x, y), or None
+    def find_path(self, start=None, goal=None):
+        grid = self.grid
+        start = grid.start if start is None else start
+        goal = grid.goal if goal is None else goal
+        goal_x, goal_y = grid.position(goal)
+        start_cluster, goal_cluster = self.cluster_of(start), self.cluster_of(goal)
+
+        # Temporary edges from the start to its cluster's entrances (and to the goal when they share one)
+        local, x0, y0 = self.cluster_maze(start_cluster)
+        targets = list(self.links[start_cluster]) + ([goal] if start_cluster == goal_cluster else [])
+        from_start = self.local_costs(local, x0, y0, start, targets)
+        local, x0, y0 = self.cluster_maze(goal_cluster)
+        to_goal = dict(self.local_costs(local, x0, y0, goal, list(self.links[goal_cluster])))
+
+        # A* over entrances: intra-cluster edges, single steps across borders, exits to the goal
+        best = {start: 0}
+        came_from = {start: (None, None)}  # node -> (previous node, cluster of the segment or None for a border step)
+        start_x, start_y = grid.position(start)
+        open_list = [(heuristic(start_x, start_y, goal_x, goal_y), 0, start)]
+        while open_list:
+            f, cost, node = heapq.heappop(open_list)
+            if cost > best.get(node, INFINITY):
+                continue
+            if node == goal:
+                break
+            k = self.cluster_of(node)
+            successors = [(other, step, k) for other, step in self.edges[k].get(node, [])]
+            successors += [(other, 1, None) for other in self.links[k].get(node, [])]
+            if node == start:
+                successors += [(other, step, start_cluster) for other, step in from_start]
+            if node in to_goal:
+                successors.append((goal, to_goal[node], goal_cluster))
+            for other, step, cluster in successors:
+                new_cost = cost + step
+                if new_cost < best.get(other, INFINITY):
+                    best[other] = new_cost
+                    came_from[other] = (node, cluster)
+                    x, y = grid.position(other)
+                    heapq.heappush(open_list, (new_cost + heuristic(x, y, goal_x, goal_y), new_cost, other))
+
+        if goal not in came_from:
+            return None
+        # Refinement: walk back over the abstract path and fill in only the segments it uses
+        segments = []
+        node = goal
+        while node != start:
+            previous, cluster = came_from[node]
+            if cluster is None:
+                segments.append([grid.position(node)])
+            else:
+                endpoint = previous == start or node == goal  # Query endpoints are not worth caching
+                segments.append(self.segment(cluster, previous, node, cache=not endpoint)[1:])
+            node = previous
+        full = [grid.position(start)]
+        for segment in reversed(segments):
+            full += segment
+        return full
+
+    # Rebuild only the borders of the cluster containing (x, y) and the clusters whose entrances changed
+    def update_cell(self, x, y):
+        k = self.cluster_of(self.grid.index(x, y))
+        dirty = {k}
+        for other in self.neighbour_clusters(k):
+            key = (min(k, other), max(k, other))
+            old = self.borders[key]
+            self.build_border(*key)
+            if self.borders[key] != old:
+                dirty.add(other)
+        for cluster in dirty:
+            self.build_cluster(cluster)
+
+    def set_wall(self, x, y):
+        self.grid.set_cell(x, y, WALL)
+        self.update_cell(x, y)
+
+    def clear_wall(self, x, y):
+        self.grid.set_cell(x, y, ord('.'))
+        self.update_cell(x, y)
+
+#<------------------------------------------------------------------------------
+
+# Batch many-to-many queries on a process pool
+# The maze is copied once into shared memory and every worker maps the same bytes. Identical pairs
+# are solved once, and all starts that share a goal are answered from one reverse BFS tree rooted at
+# that goal (moves are reversible, so the tree gives shortest paths from every start to the goal).
+
+batch_grid = None  # CompactMaze over the shared maze, set up in every worker process
+batch_memory = None  # The worker's handle on the shared memory block (kept alive with the grid)
+
+# Pool initializer: attach to the shared maze published by solve_batch
+def init_batch_worker(name, rows, cols, stride):
+    global batch_grid, batch_memory
+    batch_memory = shared_memory.SharedMemory(name=name)
+    batch_grid = CompactMaze(batch_memory.buf, rows, cols, stride, -1, -1)
+
+# Walk down a BFS distance table from cell to the BFS source, returning the path as (x, y) positions
+def descend_path(grid, dist, cell):
+    if dist[cell] < 0:
+        return None
+    path = [grid.position(cell)]
+    while dist[cell] > 0:
+        x, y = grid.position(cell)
+        for i in range(4):
+            new_x, new_y = x + row_moves[i], y + col_moves[i]
+            if 0 <= new_x < grid.rows and 0 <= new_y < grid.cols and dist[grid.index(new_x, new_y)] == dist[cell] - 1:
+                cell = grid.index(new_x, new_y)
+                break
+        path.append(grid.position(cell))
+    return path
+
+# Worker task: all starts for one goal; returns [((start, goal), path), ...]
+def run_batch_task(task):
+    goal, starts = task
+    if len(starts) == 1:  # A single query is cheaper as a focused A* search
+        return [((starts[0], goal), solve_maze_compact(batch_grid, starts[0], goal))]
+    dist = bfs_distances(batch_grid, goal)  # One reverse tree answers every start
+    return [((start, goal), descend_path(batch_grid, dist, start)) for start in starts]
+
+# Solve many (start, goal) pairs of cell indices in parallel, yielding ((start, goal), path) as they finish
+# Every distinct pair is yielded once, in completion order; path is a list of (x, y) or None.
+def solve_batch(grid, pairs, workers=None):
+    by_goal = {}
+    for start, goal in dict.fromkeys(pairs):  # dict.fromkeys drops repeated pairs but keeps their order
+        by_goal.setdefault(goal, []).append(start)
+
+    size = grid.rows * grid.stride
+    memory = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        used = min(size, len(grid.cells))  # A text maze may lack the last row's line ending
+        memory.buf[:used] = grid.cells[:used]  # Publish the maze once for all workers
+        with Pool(workers, initializer=init_batch_worker, initargs=(memory.name, grid.rows, grid.cols, grid.stride)) as pool:
+            for results in pool.imap_unordered(run_batch_task, by_goal.items()):
+                yield from results
+    finally:
+        memory.close()
+        memory.unlink()
+
+#<------------------------------------------------------------------------------
+
+# Weighted and 8-connected terrain
+# Cells carry an integer traversal cost: '1'..'9' cost their digit, '.', 'S' and 'G' cost 1 and '#'
+# is a wall. Entering a cell costs its value; with diagonal moves a straight step costs 10 times the
+# value and a diagonal step 14 times (integer octile costs, so 14/10 stands in for the square root of 2).
+# The heuristic matches the move model so it stays admissible: Manhattan for 4 moves, octile for 8,
+# both scaled by the cheapest cell cost.
+
+TERRAIN_COST = bytearray(256)  # Byte value -> traversal cost, 0 means impassable
+for char in '.SG':
+    TERRAIN_COST[ord(char)] = 1
+for digit in range(1, 10):
+    TERRAIN_COST[ord(str(digit))] = digit
+STRAIGHT, DIAGONAL = 10, 14  # Step cost multipliers for 8-connected moves
+BUCKET_LIMIT = 4096  # Largest priority span for which the bucket queue is used instead of heapq
+
+# Dial's bucket queue: a ring of buckets for integer priorities that never drop below the last pop
+# Every priority in the queue must be less than `span` above the lowest one, which holds for A* with
+# a consistent heuristic when span covers twice the largest step cost.
+class BucketQueue:
+    def __init__(self, span, first):
+        self.span = span
+        self.buckets = [[] for _ in range(span)]
+        self.current = first  # Lowest priority that can still be in the queue
+        self.count = 0
+
+    def push(self, priority, item):
+        self.buckets[priority % self.span].append(item)
+        self.count += 1
+
+    def pop(self):
+        buckets, span = self.buckets, self.span
+        while not buckets[self.current % span]:  # Amortised O(1): the cursor only moves forward
+            self.current += 1
+        self.count -= 1
+        return self.current, buckets[self.current % span].pop()
+
+    def __len__(self):
+        return self.count
+
+# Binary-heap queue with the same interface, for large or unbounded costs
+class HeapQueue:
+    def __init__(self, size):
+        self.size = size  # Items are cell indices below size, packed as priority * size + item
+        self.heap = []
+
+    def push(self, priority, item):
+        heapq.heappush(self.heap, priority * self.size + item)
+
+    def pop(self):
+        return divmod(heapq.heappop(self.heap), self.size)
+
+    def __len__(self):
+        return len(self.heap)
+
+# A* over weighted terrain; returns (path, cost) or (None, None) when the goal is unreachable
+# diagonal=True allows the 4 diagonal moves (never cutting the corner of a wall).
+# costs maps each byte of grid.cells to its traversal cost (0 = wall). queue is 'auto', 'bucket' or 'heap'.
+def solve_terrain(grid, start=None, goal=None, diagonal=False, costs=TERRAIN_COST, queue='auto', stats=None):
+    started = time.perf_counter()
+    start = grid.start if start is None else start
+    goal = grid.goal if goal is None else goal
+    cells, rows, cols, stride = grid.cells, grid.rows, grid.cols, grid.stride
+    size = rows * stride
+    goal_x, goal_y = divmod(goal, stride)
+
+    used = [c for c in costs if c]  # Costs the table can produce (never scans or copies the grid)
+    cheapest = min(used, default=1)
+    straight, step_diagonal = (STRAIGHT, DIAGONAL) if diagonal else (1, 0)
+    moves = 8 if diagonal else 4
+    move_x = row_moves + diagonal_row_moves
+    move_y = col_moves + diagonal_col_moves
+    move_scale = [straight] * 4 + [step_diagonal] * 4
+
+    # Admissible estimate: Manhattan (4 moves) or octile (8 moves) distance times the cheapest cell
+    def estimate(x, y):
+        dx, dy = abs(x - goal_x), abs(y - goal_y)
+        if diagonal:
+            return cheapest * (STRAIGHT * max(dx, dy) + (DIAGONAL - STRAIGHT) * min(dx, dy))
+        return cheapest * (dx + dy)
+
+    span = 2 * max(used, default=1) * (step_diagonal or straight) + 1  # Live priorities stay within two step costs
+    sx, sy = divmod(start, stride)
+    if queue == 'bucket' or (queue == 'auto' and span <= BUCKET_LIMIT):
+        open_list = BucketQueue(span, estimate(sx, sy))
+    else:
+        open_list = HeapQueue(size)
+
+    g = array('q', [-1]) * size  # Weighted costs can outgrow int32 on large grids
+    parent_dir = bytearray([NO_PARENT]) * size
+    g[start] = 0
+    open_list.push(estimate(sx, sy), start)
+    expanded, pushes, stale, peak = 0, 1, 0, 1
+    path = total = None
+
+    while len(open_list):
+        f, cell = open_list.pop()
+        x, y = divmod(cell, stride)
+        level = g[cell]
+        if f != level + estimate(x, y):  # A cheaper copy of this cell was already expanded
+            stale += 1
+            continue
+        expanded += 1
+        if cell == goal:
+            path, total = rebuild_path(grid, parent_dir, goal), level
+            break
+
+        for i in range(moves):
+            new_x, new_y = x + move_x[i], y + move_y[i]
+            if not (0 <= new_x < rows and 0 <= new_y < cols):
+                continue
+            child = new_x * stride + new_y
+            cost = costs[cells[child]]
+            if not cost:
+                continue
+            if i >= 4 and not (costs[cells[x * stride + new_y]] and costs[cells[new_x * stride + y]]):
+                continue  # A diagonal may not squeeze past a wall corner
+            new_level = level + cost * move_scale[i]
+            if g[child] < 0 or new_level < g[child]:
+                g[child] = new_level
+                parent_dir[child] = i
+                open_list.push(new_level + estimate(new_x, new_y), child)
+                pushes += 1
+        if len(open_list) > peak:
+            peak = len(open_list)
+
+    if stats is not None:
+        stats.nodes_expanded, stats.heap_pushes, stats.stale_pops, stats.peak_open = expanded, pushes, stale, peak
+        stats.wall_time = time.perf_counter() - started
+    return path, total
+
+#<------------------------------------------------------------------------------
+
+# Loading large mazes from disk
+# A text maze file (rows of 'S', 'G', '#', '.' or digits, one row per line) is memory-mapped and used
+# directly as the CompactMaze buffer: the newline at the end of each row just makes the stride one
+# byte longer than the row. Nothing is copied into Python objects; the map is copy-on-write, so
+# planners that edit walls never touch the file. The packed format stores one wall bit per cell on
+# disk but is expanded to one byte per cell in memory (see load_packed).
+
+PACKED_MAGIC = b'MAZ1'  # File signature of a packed maze
+PACKED_HEADER = 4 + 4 * 8  # Magic plus rows, cols, start and goal as int64
+
+# Memory-map a maze file (text or packed) and return it as a CompactMaze
+def load_maze(path):
+    with open(path, 'rb') as f:
+        if f.read(4) == PACKED_MAGIC:
+            return load_packed(f)
+        f.seek(0, 2)
+        if f.tell() == 0:
+            raise ValueError(f"{path} is empty")
+        cells = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    line_end = cells.find(b'\n')
+    if line_end < 0:  # A single row without a newline
+        line_end = len(cells)
+    cols = line_end - (line_end > 0 and cells[line_end - 1] == ord('\r'))  # Accept CRLF rows too
+    stride = line_end + 1
+    rows = (len(cells) + stride - 1) // stride
+    if len(cells) < (rows - 1) * stride + cols:
+        raise ValueError(f"{path}: the last row is shorter than the first")
+    return CompactMaze(cells, rows, cols, stride, cells.find(b'S'), cells.find(b'G'))
+
+# Expand a packed maze (wall bits, least significant bit first) into one byte per cell
+# Each of the 8 bit positions is expanded with one bytes.translate and written with one strided
+# slice assignment, so the work happens in C rather than in a Python loop over cells. The bits are
+# read from the map in PACKED_BLOCK pieces, so the payload is never copied whole.
+# Limitation: unlike a text maze, a packed maze is not searched in place. The engines read one byte
+# per cell, so the result is an ordinary bytearray of rows * cols bytes, 8 times the file size.
+# Use the text format (memory-mapped, copy-on-write) for mazes that do not fit in RAM.
+PACKED_BLOCK = 1 << 20  # Packed bytes expanded per step
+
+WALL_PLANES = [bytes(WALL if value >> k & 1 else ord('.') for value in range(256)) for k in range(8)]
+
+def load_packed(f):
+    rows, cols, start, goal = array('q', f.read(4 * 8))
+    packed_len = (rows * cols + 7) // 8
+    cells = bytearray(8 * packed_len)
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as bits:
+        if len(bits) < PACKED_HEADER + packed_len:
+            raise ValueError("packed maze file is truncated")
+        for offset in range(0, packed_len, PACKED_BLOCK):
+            data = bits[PACKED_HEADER + offset:PACKED_HEADER + min(packed_len, offset + PACKED_BLOCK)]
+            base = 8 * offset
+            for k in range(8):
+                cells[base + k:base + 8 * len(data):8] = data.translate(WALL_PLANES[k])
+    del cells[rows * cols:]
+    for cell, char in ((start, 'S'), (goal, 'G')):
+        if cell == -1:
+            continue  # The maze has no start or goal marker
+        if not 0 <= cell < rows * cols:
+            raise ValueError(f"packed maze {char} position {cell} is outside the {rows}x{cols} grid")
+        cells[cell] = ord(char)
+    return CompactMaze(cells, rows, cols, cols, start, goal)
+
+# Write a maze in the packed format (one wall bit per cell plus the start and goal positions)
+def save_packed(grid, path):
+    rows, cols, stride = grid.rows, grid.cols, grid.stride
+    cells = grid.cells[:rows * stride] if stride == cols else \
+        b''.join(grid.cells[x * stride:x * stride + cols] for x in range(rows))
+    cells = bytes(cells) + b'.' * (-len(cells) % 8)  # Pad to whole bytes
+    packed = 0
+    for k in range(8):
+        plane = cells[k::8].translate(bytes(1 << k if value == WALL else 0 for value in range(256)))
+        packed |= int.from_bytes(plane, 'little')
+    with open(path, 'wb') as f:
+        f.write(PACKED_MAGIC)
+        marks = []
+        for cell in (grid.start, grid.goal):
+            if cell < 0:
+                marks.append(-1)  # No marker: keep -1 rather than index a made-up cell
+            else:
+                x, y = grid.position(cell)
+                marks.append(x * cols + y)  # Re-index without row padding
+        array('q', [rows, cols] + marks).tofile(f)
+        f.write(packed.to_bytes(len(cells) // 8, 'little'))
+
+#<------------------------------------------------------------------------------
+
+# Path cache for repeated queries
+# Results are keyed by (start, goal, maze version); any edit through CompactMaze.set_cell bumps the
+# version, and the cache drops everything it holds as soon as it sees a new version. Every suffix of
+# an optimal path is itself an optimal path to the same goal, so each cached path also answers
+# queries that start anywhere along it.
+
+class PathCache:
+    def __init__(self, grid, capacity=1024, policy='lru', solver=solve_maze_compact):
+        if policy not in ('lru', 'fifo'):
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        self.grid = grid
+        self.capacity = capacity  # Maximum number of full paths kept
+        self.policy = policy  # 'lru' refreshes an entry on every hit, 'fifo' evicts in insertion order
+        self.solver = solver  # Any function solver(grid, start, goal) -> path or None
+        self.entries = OrderedDict()  # (start, goal, version) -> path, oldest first
+        self.suffixes = {}  # goal -> {cell on a cached path: (entry key, offset of that cell)}
+        self.version = grid.version
+        self.hits = self.suffix_hits = self.misses = self.evictions = 0
+
+    def __repr__(self):
+        return (f"PathCache(size={len(self.entries)}/{self.capacity}, hits={self.hits}, "
+                f"suffix_hits={self.suffix_hits}, misses={self.misses}, evictions={self.evictions})")
+
+    def clear(self):
+        self.entries.clear()
+        self.suffixes.clear()
+
+    # Return the path from start to goal (cell indices), solving and caching it on a miss
+    def find_path(self, start=None, goal=None):
+        grid = self.grid
+        start = grid.start if start is None else start
+        goal = grid.goal if goal is None else goal
+        if grid.version != self.version:  # The maze was edited: nothing cached is valid any more
+            self.clear()
+            self.version = grid.version
+
+        key = (start, goal, self.version)
+        if key in self.entries:
+            self.hits += 1
+            if self.policy == 'lru':
+                self.entries.move_to_end(key)
+            return self.entries[key]
+        along = self.suffixes.get(goal, {}).get(start)
+        if along is not None:  # start lies on a cached path to the same goal
+            self.suffix_hits += 1
+            if self.policy == 'lru':
+                self.entries.move_to_end(along[0])
+            return self.entries[along[0]][along[1]:]
+
+        self.misses += 1
+        path = self.solver(grid, start, goal)
+        self.entries[key] = path
+        if path is not None:
+            index = self.suffixes.setdefault(goal, {})
+            for offset, (x, y) in enumerate(path):
+                index.setdefault(grid.index(x, y), (key, offset))
+        if len(self.entries) > self.capacity:
+            self.evict()
+        return path
+
+    # Drop the oldest (or least recently used) entry and the suffix links that point into it
+    def evict(self):
+        (start, goal, version), path = self.entries.popitem(last=False)
+        self.evictions += 1
+        index = self.suffixes.get(goal)
+        if path is None or index is None:
+            return
+        for x, y in path:
+            cell = self.grid.index(x, y)
+            if index.get(cell, (None,))[0] == (start, goal, version):
+                del index[cell]
+        if not index:
+            del self.suffixes[goal]
 
 # Maze Configuration: A 5x5 grid with 'S' for start, 'G' for goal, '#' for walls, and '.' for empty spaces
 maze = [
@@ -104,14 +1226,24 @@ maze = [
     ['.', '.', '.', '.', '.']
 ]
 
-# Print initial instructions and the maze
-print("V- Visited, P- Path, S- Start, G- Goal")
-print("#- Wall, .- Empty \n")
-print("Initial Maze:")
-print_maze(maze)
+# Run the demo only when the script is executed directly, so the engines above can be imported
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # A maze file was given: solve it quietly with the compact engine and report the statistics
+        grid = load_maze(sys.argv[1])
+        stats = SearchStats()
+        path = solve_maze_compact(grid, stats=stats)
+        print(f"Maze {grid.rows}x{grid.cols}:", f"path of {len(path) - 1} steps" if path else "no solution found")
+        print(stats)
+    else:
+        # Print initial instructions and the maze
+        print("V- Visited, P- Path, S- Start, G- Goal")
+        print("#- Wall, .- Empty \n")
+        print("Initial Maze:")
+        print_maze(maze)
 
-# Call the solve_maze function to start the A* algorithm and find the solution
-solve_maze(maze)
+        # Call the solve_maze function to start the A* algorithm and find the solution
+        solve_maze(maze)
 
 #informed search algo, eg Greedy Best First Search (f(n) = h(n)) and astar.
 #Pathfinding and Navigation, Route Planning, AI for Search Problems:, Puzzle Solvers:, AI Path Planning in Autonomous Vehicles.
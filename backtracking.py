@@ -1,18 +1,24 @@
+import sys
+from array import array  # Compact per-solution column arrays
+
 # This class implements the N-Queens problem using backtracking
 class NQueens_Backtracking:
     
     # Constructor method: initializes board size and sets up the board
-    def __init__(self) -> None:
-        self.size = int(input("Enter size of chessboard: "))  # User inputs N (size of NxN chessboard)
+    # With count_only=True nothing is printed and the N x N board is never built
+    def __init__(self, size=None, count_only=False) -> None:
+        self.size = int(input("Enter size of chessboard: ")) if size is None else size  # User inputs N (size of NxN chessboard)
+        self.count_only = count_only
         # Initialize the chessboard with False values (no queens placed yet)
-        self.board = [[False]*self.size for _ in range(self.size)]
+        self.board = None if count_only else [[False]*self.size for _ in range(self.size)]
+        self.queens = [0] * self.size  # Column of the queen in each filled row
         self.count = 0  # Counter to track number of valid solutions
 
     # Method to print the current state of the board
     def printBoard(self):
-        for row in self.board:
-            for ele in row:
-                if ele == True:
+        for row in range(self.size):
+            for col in range(self.size):
+                if col == self.queens[row]:
                     print("Q", end=" ")  # 'Q' represents a queen
                 else:
                     print(".", end=" ")  # '.' represents an empty cell
@@ -22,6 +28,13 @@ class NQueens_Backtracking:
     # Method to check if placing a queen at (row, col) is safe
     def isSafe(self, row: int, col: int) -> bool:
         
+        # Without a board, compare against the queen already placed in each earlier row
+        if self.board is None:
+            for r in range(row):
+                if self.queens[r] == col or abs(self.queens[r] - col) == row - r:
+                    return False
+            return True
+
         # Check vertically in the current column for any queen
         for i in self.board:
             if i[col] == True:
@@ -53,20 +66,46 @@ class NQueens_Backtracking:
         # Base case: All rows are filled successfully
         if row == self.size:
             self.count += 1  # Found a valid solution
-            self.printBoard()  # Print the valid board configuration
+            if not self.count_only:
+                self.printBoard()  # Print the valid board configuration
             return
 
         # Try placing a queen in each column of the current row
         for col in range(self.size):
             if self.isSafe(row, col):  # Only proceed if it's safe
-                self.board[row][col] = True  # Place the queen
+                self.place(row, col)         # Place the queen
                 self.solve(row + 1)          # Recurse to next row
-                self.board[row][col] = False  # Backtrack (remove queen)
+                self.remove(row, col)        # Backtrack (remove queen)
+
+    # Lazily yield every solution as an array of queen columns, one entry per row
+    def solutions(self, row: int = 0):
+        if row == self.size:
+            yield array('i', self.queens)  # A copy: the search keeps changing self.queens
+            return
+        for col in range(self.size):
+            if self.isSafe(row, col):
+                self.place(row, col)
+                try:
+                    yield from self.solutions(row + 1)
+                finally:
+                    self.remove(row, col)  # Also runs when the consumer stops early (break or close())
+
+    # Place a queen at (row, col)
+    def place(self, row: int, col: int):
+        self.queens[row] = col
+        if self.board is not None:
+            self.board[row][col] = True
+
+    # Remove the queen at (row, col)
+    def remove(self, row: int, col: int):
+        if self.board is not None:
+            self.board[row][col] = False
 
-# Create object of the class and start solving
-solver = NQueens_Backtracking()
-solver.solve(0)  # Start from row 0
-print("Total number of solutions: ", solver.count)  # Print final solution count
+# Create object of the class and start solving (python backtracking.py --count only counts)
+if __name__ == "__main__":
+    solver = NQueens_Backtracking(count_only="--count" in sys.argv)
+    solver.solve(0)  # Start from row 0
+    print("Total number of solutions: ", solver.count)  # Print final solution count
 
 #Time Complexity: O(N!) Space Complexity: O(N) or O(N^2), depending on implementation
 #1, Optimization Approaches: Hill Climbing Assign one queen per column (so domain = row positions).Define a cost function: number of conflicts. Minimize this cost via stochastic or greedy strategies.
@@ -0,0 +1,39 @@
+# Benchmark for the grid path-finding engines in astar.py
+# Builds open maps with a few rectangular wall blocks and compares plain A* with Jump Point Search
+# on the size of the open list, the number of heap pushes and expansions, and the time taken.
+import random  # Random wall placement (seeded, so runs are repeatable)
+
+from astar import CompactMaze, SearchStats, solve_maze_compact
+
+# Build an open rows x cols map with `blocks` random rectangular wall blocks, S top-left and G bottom-right
+def open_map(rows, cols, blocks, seed=1):
+    rng = random.Random(seed)
+    cells = bytearray(b'.') * (rows * cols)
+    for _ in range(blocks):
+        top, left = rng.randrange(rows), rng.randrange(cols)
+        height, width = rng.randint(1, rows // 10 + 1), rng.randint(1, cols // 10 + 1)
+        for x in range(top, min(rows, top + height)):
+            cells[x * cols + left:x * cols + min(cols, left + width)] = b'#' * (min(cols, left + width) - left)
+    start, goal = 0, rows * cols - 1
+    cells[start], cells[goal] = ord('S'), ord('G')
+    return CompactMaze(cells, rows, cols, cols, start, goal)
+
+# Run one engine and return its statistics together with the path length
+def run(grid, mode):
+    stats = SearchStats()
+    path = solve_maze_compact(grid, stats=stats, mode=mode)
+    return stats, (len(path) if path else None)
+
+# Print one comparison row per map
+def benchmark(sizes=(100, 300, 600), block_counts=(0, 10, 40)):
+    print(f"{'map':>14} {'mode':>6} {'len':>6} {'peak open':>10} {'pushes':>9} {'expanded':>9} {'time (s)':>9}")
+    for n in sizes:
+        for blocks in block_counts:
+            grid = open_map(n, n, blocks)
+            for mode in ('astar', 'jps'):
+                stats, length = run(grid, mode)
+                print(f"{n}x{n} +{blocks:<4} {mode:>6} {str(length):>6} {stats.peak_open:>10} "
+                      f"{stats.heap_pushes:>9} {stats.nodes_expanded:>9} {stats.wall_time:>9.4f}")
+
+if __name__ == "__main__":
+    benchmark()
@@ -1,3 +1,9 @@
+import itertools  # Vertex offsets as running sums of the degrees
+import mmap  # Edge-list files are parsed straight from a memory map
+import sys
+from array import array  # Compact CSR arrays instead of per-vertex Python lists
+from collections import Counter, defaultdict, deque
+
 # Function to build an undirected graph using adjacency list
 def build_graph():
     graph = {}  # Initialize an empty dictionary to store the graph
@@ -14,10 +20,82 @@ def build_graph():
         graph[v].append(u)  # Add u to v's list (because the graph is undirected)
     return graph  # Return the constructed graph
 
+# Compressed sparse row graph: the neighbours of vertex i are neighbours[offsets[i]:offsets[i + 1]]
+# Vertices are dense integer ids; labels[i] is the original name of vertex i. It supports the same
+# get(node, default) lookup as the dict from build_graph, so the traversals below run over either.
+class CSRGraph:
+    def __init__(self, offsets, neighbours, labels):
+        self.offsets = offsets  # len(labels) + 1 entries
+        self.neighbours = neighbours  # Two entries per undirected edge
+        self.labels = labels  # Id -> label
+        self.ids = {label: i for i, label in enumerate(labels)}  # Label -> id
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, node):
+        return isinstance(node, int) and 0 <= node < len(self.labels)
+
+    def __getitem__(self, node):
+        return self.neighbours[self.offsets[node]:self.offsets[node + 1]]
+
+    def get(self, node, default=None):
+        return self[node] if node in self else default
+
+    def id_of(self, label):
+        return self.ids[label]
+
+    def label_of(self, node):
+        return self.labels[node]
+
+# Label to print for a vertex: CSR graphs store ids, dict graphs store the labels themselves
+def name(graph, node):
+    return graph.label_of(node) if isinstance(graph, CSRGraph) else node
+
+# Load an undirected graph from a file of whitespace-separated "u v" pairs into a CSRGraph
+# The memory-mapped file is split a block of lines at a time and labels are interned to ids in
+# first-seen order, so the only per-edge storage is int arrays: the endpoint ids while loading, then
+# the CSR itself, built with a counting pass (degrees, then offsets, then fill) instead of a sort.
+# Neighbours keep the order build_graph would give them, so traversals visit vertices identically.
+LOAD_BLOCK = 1 << 20  # Bytes of the file split per step (extended to the next line break)
+
+def load_edge_list(path):
+    ids = defaultdict()
+    ids.default_factory = ids.__len__  # An unseen label gets the next dense id
+    endpoints = array('i')  # u0 v0 u1 v1 ...: edge endpoints in file order
+    with open(path, 'rb') as f:
+        f.seek(0, 2)
+        if f.tell() == 0:
+            return CSRGraph(array('i', [0]), array('i'), [])
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            position = 0
+            while position < len(data):
+                end = data.find(b'\n', position + LOAD_BLOCK)
+                end = len(data) if end < 0 else end + 1
+                endpoints.fromlist(list(map(ids.__getitem__, data[position:end].split())))
+                position = end
+    if len(endpoints) % 2:
+        raise ValueError(f"{path}: odd number of vertex labels, the last edge is incomplete")
+    code = 'i' if len(endpoints) < 2 ** 31 else 'q'
+
+    degree = Counter(endpoints)  # A self-loop counts twice, as build_graph lists it twice
+    offsets = array(code, [0])
+    offsets.extend(itertools.accumulate(map(degree.__getitem__, range(len(ids)))))
+    del degree
+    fill = offsets[:-1]  # Next free slot in each vertex's neighbour range
+    neighbours = array(code, bytes(len(endpoints) * array(code).itemsize))
+    pairs = iter(endpoints)
+    for u, v in zip(pairs, pairs):
+        neighbours[fill[u]] = v
+        fill[u] += 1
+        neighbours[fill[v]] = u
+        fill[v] += 1
+    return CSRGraph(offsets, neighbours, [label.decode() for label in ids])
+
 # Depth-First Search (Recursive Version)
 def dfs_recursive(graph, node, visited):
     if node not in visited:  # Process only unvisited nodes
-        print(node, end=" ")  # Print the node
+        print(name(graph, node), end=" ")  # Print the node
         visited.add(node)     # Mark node as visited
         for neighbor in graph.get(node, []):  # Explore all neighbors
             dfs_recursive(graph, neighbor, visited)  # Recur for each neighbor
@@ -29,7 +107,7 @@ def dfs_non_recursive(graph, start):
     while stack:
         node = stack.pop()  # Pop the last inserted node
         if node not in visited:
-            print(node, end=" ")  # Print node
+            print(name(graph, node), end=" ")  # Print node
             visited.add(node)     # Mark as visited
             # Add neighbors to the stack in reversed order to maintain left-to-right traversal
             stack.extend(reversed(graph.get(node, [])))
@@ -37,11 +115,11 @@ def dfs_non_recursive(graph, start):
 # Breadth-First Search (Non-Recursive Version using Queue)
 def bfs_non_recursive(graph, start):
     visited = set()     # Track visited nodes
-    queue = [start]     # Initialize queue with starting node
+    queue = deque([start])  # Initialize queue with starting node (deque: O(1) pops from the front)
     while queue:
-        node = queue.pop(0)  # Remove node from front of the queue
+        node = queue.popleft()  # Remove node from front of the queue
         if node not in visited:
-            print(node, end=" ")  # Print node
+            print(name(graph, node), end=" ")  # Print node
             visited.add(node)     # Mark as visited
             # Add unvisited neighbors to the queue
             queue.extend([n for n in graph.get(node, []) if n not in visited])
@@ -52,36 +130,183 @@ def bfs_recursive(graph, queue, visited):
         return
     node = queue.pop(0)  # Process front of queue
     if node not in visited:
-        print(node, end=" ")  # Print node
+        print(name(graph, node), end=" ")  # Print node
         visited.add(node)     # Mark as visited
         # Add unvisited neighbors to queue
         queue.extend([n for n in graph.get(node, []) if n not in visited])
     bfs_recursive(graph, queue, visited)  # Recursive call for next node in queue
 
-# ----------- Main Driver Code -----------
+# Recursion-free drop-in versions of dfs_recursive and bfs_recursive: same arguments, same output,
+# but no Python frame per vertex, so they do not hit the recursion limit on long paths
+def dfs_iterative(graph, node, visited):
+    for vertex in iter_dfs(graph, node, visited=visited):
+        print(name(graph, vertex), end=" ")
 
-# Build graph from user input
-graph = build_graph()
+def bfs_iterative(graph, queue, visited):
+    queue = deque(queue)
+    while queue:
+        node = queue.popleft()
+        if node not in visited:
+            print(name(graph, node), end=" ")
+            visited.add(node)
+            queue.extend(n for n in graph.get(node, []) if n not in visited)
+
+# Explicit-stack DFS with discovery and finish times from one shared clock, as in CLRS
+# Each frame is a vertex and an iterator over its remaining neighbours, so memory is one frame per
+# tree level rather than a stacked copy of every neighbour list. Returns (order, pre, post): the
+# vertices in dfs_recursive's visit order and dicts mapping each vertex to its timestamps.
+def dfs_timestamps(graph, start, visited=None):
+    visited = set() if visited is None else visited
+    order, pre, post = [], {}, {}
+    if start in visited:
+        return order, pre, post
+    clock = 0
+    visited.add(start)
+    order.append(start)
+    pre[start] = clock
+    stack = [(start, iter(graph.get(start, [])))]
+    while stack:
+        node, neighbours = stack[-1]
+        for neighbor in neighbours:
+            if neighbor not in visited:
+                clock += 1
+                visited.add(neighbor)
+                order.append(neighbor)
+                pre[neighbor] = clock
+                stack.append((neighbor, iter(graph.get(neighbor, []))))
+                break
+        else:
+            clock += 1
+            post[node] = clock
+            stack.pop()
+    return order, pre, post
+
+# Lazy traversals: vertices are yielded one at a time, so the caller can stop at the first match
+# and no work is done past it. With info=True each item is (vertex, depth, parent); the start has
+# parent None. The visit order is the same as dfs_recursive and bfs_non_recursive respectively.
+
+# DFS keeps one neighbour iterator per open vertex, so extra memory is one frame per tree level
+# Pass a visited set to share it between several calls, as dfs_recursive does.
+def iter_dfs(graph, start, info=False, visited=None):
+    visited = set() if visited is None else visited
+    if start in visited:
+        return
+    visited.add(start)
+    yield (start, 0, None) if info else start
+    stack = [(start, iter(graph.get(start, [])))]
+    while stack:
+        parent, neighbours = stack[-1]
+        for node in neighbours:  # Resume where this vertex's scan stopped
+            if node not in visited:
+                visited.add(node)
+                yield (node, len(stack), parent) if info else node
+                stack.append((node, iter(graph.get(node, []))))
+                break
+        else:
+            stack.pop()  # All neighbours done: backtrack
+
+# BFS marks vertices when they are queued, so each vertex enters the queue at most once
+def iter_bfs(graph, start, info=False):
+    visited = {start}
+    queue = deque([(start, 0, None)])
+    while queue:
+        node, depth, parent = queue.popleft()
+        yield (node, depth, parent) if info else node
+        for neighbor in graph.get(node, []):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append((neighbor, depth + 1, node))
+
+# Direction-optimizing BFS (Beamer et al.) over a CSRGraph
+# Top-down steps scan the edges out of the frontier. Bottom-up steps instead let every unvisited
+# vertex look for any parent in the frontier and stop at the first one. That is much cheaper in the
+# middle levels of low-diameter graphs, where the frontier holds most of the vertices. The frontier
+# and visited sets are byte-per-vertex bitmaps, so membership tests are a single index.
+ALPHA = 14  # Go bottom-up once frontier edges exceed unexplored edges / ALPHA
+BETA = 24  # Go back top-down once the frontier shrinks below vertices / BETA
+UNVISITED = bytes.maketrans(b'\x00\x01', b'\x01\x00')  # Flips a 0/1 visited map
+
+# Returns (dist, parent) arrays over vertex ids; unreached vertices and the start have parent -1,
+# unreached vertices have dist -1. If levels is a list, (direction, frontier size) is appended per level.
+def bfs_direction_optimizing(graph, start, alpha=ALPHA, beta=BETA, levels=None):
+    offsets, neighbours = graph.offsets, graph.neighbours
+    n = len(graph)
+    dist = array('i', [-1]) * n
+    parent = array('i', [-1]) * n
+    visited = bytearray(n)
+    visited[start] = 1
+    dist[start] = 0
+    frontier = [start]
+    frontier_edges = offsets[start + 1] - offsets[start]  # m_f: edges to check top-down
+    unexplored_edges = len(neighbours) - frontier_edges  # m_u: edges to check bottom-up
+    bottom_up = False
+    depth = 0
+    while frontier:
+        depth += 1
+        if bottom_up:
+            bottom_up = len(frontier) >= n / beta
+        else:
+            bottom_up = frontier_edges > unexplored_edges / alpha
+        if levels is not None:
+            levels.append(('bottom-up' if bottom_up else 'top-down', len(frontier)))
+        found = []
+        if bottom_up:
+            in_frontier = bytearray(n)
+            for u in frontier:
+                in_frontier[u] = 1
+            for v in itertools.compress(range(n), visited.translate(UNVISITED)):
+                for u in neighbours[offsets[v]:offsets[v + 1]]:
+                    if in_frontier[u]:  # Any parent will do: stop at the first
+                        visited[v] = 1
+                        parent[v] = u
+                        dist[v] = depth
+                        found.append(v)
+                        break
+        else:
+            for u in frontier:
+                for v in neighbours[offsets[u]:offsets[u + 1]]:
+                    if not visited[v]:
+                        visited[v] = 1
+                        parent[v] = u
+                        dist[v] = depth
+                        found.append(v)
+        frontier = found
+        frontier_edges = sum(offsets[v + 1] - offsets[v] for v in frontier)
+        unexplored_edges -= frontier_edges
+    return dist, parent
+
+# ----------- Main Driver Code -----------
 
-# Read starting node for traversal
-start_node = input("Enter starting node: ")
+if __name__ == "__main__":
+    # Build graph from user input, or load it from an edge-list file: python bfs_dfs.py EDGE_FILE
+    from_file = len(sys.argv) > 1
+    if from_file:
+        graph = load_edge_list(sys.argv[1])
+        start_node = graph.id_of(input("Enter starting node: "))
+    else:
+        graph = build_graph()
+        start_node = input("Enter starting node: ")
 
-# Run and display DFS (Recursive)
-print("\nDFS Recursive Traversal:")
-dfs_recursive(graph, start_node, set())
+    # Graphs from a file can be far deeper than the recursion limit, so there the recursive versions
+    # are replaced by their stack-based equivalents (same output, no Python frame per vertex)
+    dfs = dfs_iterative if from_file else dfs_recursive
+    bfs = bfs_iterative if from_file else bfs_recursive
 
-# Run and display DFS (Non-Recursive)
-print("\nDFS Non-Recursive Traversal:")
-dfs_non_recursive(graph, start_node)
+    # Run and display DFS (Recursive)
+    print("\nDFS Recursive Traversal:")
+    dfs(graph, start_node, set())
 
-# Run and display BFS (Non-Recursive)
-print("\nBFS Non-Recursive Traversal:")
-bfs_non_recursive(graph, start_node)
+    # Run and display DFS (Non-Recursive)
+    print("\nDFS Non-Recursive Traversal:")
+    dfs_non_recursive(graph, start_node)
 
-# Run and display BFS (Recursive)
-print("\nBFS Recursive Traversal:")
-bfs_recursive(graph, [start_node], set())
+    # Run and display BFS (Non-Recursive)
+    print("\nBFS Non-Recursive Traversal:")
+    bfs_non_recursive(graph, start_node)
 
+    # Run and display BFS (Recursive)
+    print("\nBFS Recursive Traversal:")
+    bfs(graph, [start_node], set())
 
 
 # DFS:
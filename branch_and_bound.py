@@ -1,12 +1,21 @@
+import json
+import os
+import struct
+import sys
+import tempfile
 import time
+from array import array  # Compact per-solution column arrays
 
 class NQueens_Branch_Bound_Stepwise:
-    def __init__(self) -> None:
-        # Input size of chessboard (N x N)
-        self.size = int(input("Enter size of chessboard: "))  # Size of the chessboard (N x N)
-        
+    def __init__(self, size=None, count_only=False) -> None:
+        # Input size of chessboard (N x N) unless it is given
+        self.size = int(input("Enter size of chessboard: ")) if size is None else size  # Size of the chessboard (N x N)
+        self.count_only = count_only  # Only count solutions: nothing is printed and no board is built
+
         # Initialize the chessboard with all False values (No queens placed initially)
-        self.board = [[False]*self.size for _ in range(self.size)]  # Initialize the board
+        # The N x N board is only needed for printing, so count-only runs leave it out
+        self.board = None if count_only else [[False]*self.size for _ in range(self.size)]
+        self.queens = [0] * self.size  # Column of the queen in each filled row
         
         # Arrays to track if a column, forward diagonal or backward diagonal is occupied by a queen
         self.columns = [False] * self.size  # To track if a column is occupied
@@ -18,9 +27,9 @@ class NQueens_Branch_Bound_Stepwise:
 
     def printBoard(self):
         """This function prints the chessboard with queens marked by 'Q' and empty spaces by '.'"""
-        for row in self.board:
-            # For each row, print 'Q' if the cell is True (queen placed), else print '.'
-            print(" ".join("Q" if cell else "." for cell in row))
+        for row in range(self.size):
+            # For each row, print 'Q' in the queen's column, else print '.'
+            print(" ".join("Q" if col == self.queens[row] else "." for col in range(self.size)))
         print()  # Blank line after printing the board
 
     def isSafe(self, row, col):
@@ -38,13 +47,31 @@ class NQueens_Branch_Bound_Stepwise:
             return False  # Not safe
         return True  # Safe to place the queen
 
+    def place(self, row, col):
+        """Puts a queen on (row, col) and marks its column and diagonals as occupied."""
+        self.queens[row] = col
+        if self.board is not None:
+            self.board[row][col] = True
+        self.columns[col] = True
+        self.fsDiagonal[row + col] = True
+        self.bsDiagonal[row - col + self.size - 1] = True
+
+    def remove(self, row, col):
+        """Backtrack: takes the queen off (row, col) and frees its column and diagonals."""
+        if self.board is not None:
+            self.board[row][col] = False
+        self.columns[col] = False
+        self.fsDiagonal[row + col] = False
+        self.bsDiagonal[row - col + self.size - 1] = False
+
     def solve(self, row):
         """Recursively attempts to place queens on the board row by row."""
         
         # If we've placed queens on all rows, it's a valid solution
         if row == self.size:
-            print("✅ Solution Found:")  # Solution found, print the board
-            self.printBoard()  # Print the current arrangement of queens
+            if not self.count_only:
+                print("✅ Solution Found:")  # Solution found, print the board
+                self.printBoard()  # Print the current arrangement of queens
             self.count += 1  # Increment the count of solutions found
             return
 
@@ -54,30 +81,65 @@ class NQueens_Branch_Bound_Stepwise:
 
             if self.isSafe(row, col):  # If it's safe to place a queen in (row, col)
                 #print(f"✔️ Safe to place at ({row}, {col}) — placing Queen.")
-                
-                # Place the queen by marking the cell as True
-                self.board[row][col] = True
-                # Mark the column as occupied
-                self.columns[col] = True
-                
-                # Mark the forward and backward diagonals as occupied
-                fs = row + col
-                bs = row - col + self.size - 1
-                self.fsDiagonal[fs] = True
-                self.bsDiagonal[bs] = True
+                self.place(row, col)  # Place the queen and mark its column and diagonals
 
                 # Recurse to the next row to place the next queen
                 self.solve(row + 1)
 
                 # Backtrack: remove the queen from (row, col) and unmark the column and diagonals
                 #print(f"↩️ Backtracking from ({row}, {col}) — removing Queen.")
-                self.board[row][col] = False  # Remove the queen
-                self.columns[col] = False  # Unmark the column
-                self.fsDiagonal[fs] = False  # Unmark the forward diagonal
-                self.bsDiagonal[bs] = False  # Unmark the backward diagonal
+                self.remove(row, col)
             #else:
                 #print(f"❌ Not safe at ({row}, {col}) — trying next column.")
 
+    def solutions(self, row=0):
+        """Lazily yields every solution as an array of queen columns, one entry per row."""
+        if row == self.size:
+            yield array('i', self.queens)  # A copy: the search keeps changing self.queens
+            return
+        for col in range(self.size):
+            if self.isSafe(row, col):
+                self.place(row, col)
+                try:
+                    yield from self.solutions(row + 1)
+                finally:
+                    self.remove(row, col)  # Also runs when the consumer stops early (break or close())
+
+    def start_resumable(self, checkpoint_path, results_path=None):
+        """
+        Counts solutions one top-level subtree (first-row column) at a time, saving a checkpoint
+        after each finished subtree. A restarted run skips the subtrees the checkpoint lists.
+        Finished counts go into a results table, so asking for the same N again returns at once.
+        """
+        results_path = RESULTS_FILE if results_path is None else results_path
+        known = read_json(results_path, {}).get(str(self.size))
+        if known is not None:
+            self.count = known
+            return self.count
+
+        state = read_json(checkpoint_path, None)
+        if state is None or state["size"] != self.size:
+            state = {"size": self.size, "done": [], "count": 0}  # Nothing usable: start from scratch
+        self.count = state["count"]
+        if self.size == 0:
+            self.solve(0)  # The empty board is the only solution
+        for col in range(self.size):
+            if col in state["done"]:
+                continue  # Finished before the restart: its solutions are already in the count
+            self.place(0, col)
+            self.solve(1)
+            self.remove(0, col)
+            state["done"].append(col)
+            state["count"] = self.count
+            write_json_atomic(checkpoint_path, state)
+
+        results = read_json(results_path, {})  # Re-read: another run may have added entries meanwhile
+        results[str(self.size)] = self.count
+        write_json_atomic(results_path, results)
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)  # The results table now holds the answer
+        return self.count
+
     def start(self):
         """Starts the N-Queens solver and tracks the time taken."""
         start_time = time.time()  # Record the start time
@@ -86,9 +148,101 @@ class NQueens_Branch_Bound_Stepwise:
         print(f"\nTotal Solutions: {self.count}")
         print(f"⏱️ Time Taken: {time.time() - start_time:.4f} seconds")
 
+# Checkpoints and the results table are small JSON files
+RESULTS_FILE = "nqueens_results.json"  # Persistent table of finished counts: {"N": count}
+
+def read_json(path, default):
+    """Loads a JSON file, or returns default if it does not exist yet."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+def write_json_atomic(path, data):
+    """
+    Writes JSON through a temporary file in the same folder and renames it over path,
+    so a crash at any moment leaves either the old file or the new one, never a torn one.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())  # Data on disk before the rename makes it visible
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+# Binary solution files: SOLUTION_MAGIC, N as a 4-byte unsigned int, then one record per solution
+# holding the queen's column for every row in 1, 2 or 4 bytes each, the smallest that fits N
+# Everything is little-endian, so files read back the same on any machine. The only N = 0 solution,
+# the empty board, has no columns and is stored as one zero byte so it can still be counted.
+SOLUTION_MAGIC = b'NQS1'
+SOLUTION_HEADER = struct.Struct('<4sI')
+MAX_SOLUTION_SIZE = 2 ** 32 - 1  # N must fit the 4-byte header field
+
+def solution_code(size):
+    """Array typecode of the column entries for a board of the given size."""
+    for code in ('B', 'H', 'I', 'L'):
+        if size <= 2 ** (8 * array(code).itemsize):
+            return code
+    raise ValueError(f"board size {size} is too large for a solution file")
+
+def write_solutions(path, size, solutions):
+    """Streams solutions (sequences of columns) to a binary file and returns how many were written."""
+    if not 0 <= size <= MAX_SOLUTION_SIZE:
+        raise ValueError(f"board size {size} does not fit a solution file")  # Checked before the file is created
+    code = solution_code(size)
+    swap = code != 'B' and sys.byteorder == 'big'
+    count = 0
+    with open(path, 'wb') as f:
+        f.write(SOLUTION_HEADER.pack(SOLUTION_MAGIC, size))
+        for queens in solutions:
+            record = array(code, queens)
+            if swap:
+                record.byteswap()
+            f.write(record.tobytes() if size else b'\0')
+            count += 1
+    return count
+
+def read_solutions(path):
+    """Lazily yields the solutions stored by write_solutions as arrays of columns."""
+    with open(path, 'rb') as f:
+        header = f.read(SOLUTION_HEADER.size)
+        if len(header) < SOLUTION_HEADER.size or header[:4] != SOLUTION_MAGIC:
+            raise ValueError(f"{path} is not an N-Queens solution file")
+        size = SOLUTION_HEADER.unpack(header)[1]
+        code = solution_code(size)
+        swap = code != 'B' and sys.byteorder == 'big'
+        record = max(1, size * array(code).itemsize)
+        while True:
+            data = f.read(record)
+            if len(data) < record:
+                return
+            queens = array(code, data if size else b'')
+            if swap:
+                queens.byteswap()
+            yield queens
+
 # Run the NQueens solver with Branch and Bound method
-solver = NQueens_Branch_Bound_Stepwise()  # Create an instance of the solver class
-solver.start()  # Start the solution process
+# python branch_and_bound.py --count only counts; python branch_and_bound.py --write FILE streams solutions to FILE;
+# python branch_and_bound.py --resume FILE counts with checkpoints in FILE and picks up where a killed run stopped
+if __name__ == "__main__":
+    if "--resume" in sys.argv:
+        solver = NQueens_Branch_Bound_Stepwise(count_only=True)
+        start_time = time.time()
+        solver.start_resumable(sys.argv[sys.argv.index("--resume") + 1])
+        print(f"\nTotal Solutions: {solver.count}")
+        print(f"⏱️ Time Taken: {time.time() - start_time:.4f} seconds")
+    elif "--write" in sys.argv:
+        solver = NQueens_Branch_Bound_Stepwise(count_only=True)
+        path = sys.argv[sys.argv.index("--write") + 1]
+        print(f"\nWrote {write_solutions(path, solver.size, solver.solutions())} solutions to {path}")
+    else:
+        solver = NQueens_Branch_Bound_Stepwise(count_only="--count" in sys.argv)  # Create an instance of the solver class
+        solver.start()  # Start the solution process
 
 
 #Branch and Bound systematically explores all possible solutions in a state space tree, but prunes (cuts off) parts of the search tree that cannot lead to a better solution than what we’ve already found
@@ -1,3 +1,9 @@
+import os
+import random
+import time
+from array import array
+from multiprocessing import Pool
+
 def branch():
     
     class NQueens_Branch_Bound_Stepwise:
@@ -161,14 +167,255 @@ def back():
     solver.solve(0)  # Start from row 0
     print("Total number of solutions: ", solver.count)  # Print final solution count
 #back()
+
+# Bitboard N-Queens: columns and both diagonals are integer bitmasks instead of an N x N board
+# Bit c of cols is set when column c already holds a queen. left and right are the diagonals that
+# attack the current row; they shift by one column per row. avail & -avail isolates the lowest free
+# column, so each row only ever looks at columns that are actually safe.
+
+# Count the solutions that complete a partial placement of rows 0 .. row-1
+def count_subtree(size, row, cols, left, right):
+    full = (1 << size) - 1  # One bit per column
+
+    def place(row, cols, left, right):
+        avail = full & ~(cols | left | right)  # Safe columns in this row
+        if row == size - 1:
+            return bin(avail).count("1")  # Every safe column in the last row is a solution
+        total = 0
+        while avail:
+            bit = avail & -avail  # Lowest safe column
+            avail ^= bit
+            total += place(row + 1, cols | bit, (left | bit) << 1, (right | bit) >> 1)
+        return total
+
+    if row == size:
+        return 1
+    return place(row, cols, left, right)
+
+# Count all solutions, exploring only the left half of the first row
+# A solution with its first queen in column c mirrors to one with it in column size-1-c, so the left
+# half is counted twice. With an odd size the middle column is its own mirror and counted once.
+def count_bitboard(size):
+    total = 0
+    for col in range(size // 2):
+        bit = 1 << col
+        total += count_subtree(size, 1, bit, bit << 1, bit >> 1)
+    total *= 2
+    if size % 2:
+        bit = 1 << (size // 2)
+        total += count_subtree(size, 1, bit, bit << 1, bit >> 1)
+    if size == 0:
+        total = 1  # The empty board, as the other solvers count it
+    return total
+
+# Parallel counting: the first rows are expanded into independent prefixes, each with its own
+# column and diagonal masks, and a process pool counts their subtrees. Subtree sizes vary a lot,
+# so tasks are handed out one at a time as workers free up instead of being split up front.
+
+TASKS_PER_WORKER = 32  # Expand prefixes until there are at least this many tasks per worker
+
+# All safe placements of the first rows as (row, cols, left, right, weight) tasks
+# The first row only uses the left half (weight 2 counts the mirror image too, as in count_bitboard).
+# With prefix_rows=None rows are added until there are at least `tasks` prefixes.
+def queen_prefixes(size, prefix_rows=None, tasks=1):
+    full = (1 << size) - 1
+    level = []
+    for col in range((size + 1) // 2):
+        bit = 1 << col
+        weight = 1 if size % 2 and col == size // 2 else 2
+        level.append((bit, bit << 1, bit >> 1, weight))
+    row = 1
+    while row < size and (len(level) < tasks if prefix_rows is None else row < prefix_rows):
+        expanded = []
+        for cols, left, right, weight in level:
+            avail = full & ~(cols | left | right)
+            while avail:
+                bit = avail & -avail
+                avail ^= bit
+                expanded.append((cols | bit, (left | bit) << 1, (right | bit) >> 1, weight))
+        level = expanded
+        row += 1
+    return [(row, cols, left, right, weight) for cols, left, right, weight in level]
+
+# Worker task: count one prefix's subtree; returns (worker pid, weighted count, seconds spent)
+def run_prefix_task(task):
+    size, row, cols, left, right, weight = task
+    start_time = time.perf_counter()
+    count = weight * count_subtree(size, row, cols, left, right)
+    return os.getpid(), count, time.perf_counter() - start_time
+
+# Count all solutions with a pool of worker processes
+# If report is a dict it is filled with pid -> [tasks done, busy seconds] to show the load balance.
+def count_parallel(size, workers=None, prefix_rows=None, report=None):
+    if size == 0:
+        return 1
+    workers = workers or os.cpu_count() or 1
+    prefixes = queen_prefixes(size, prefix_rows, TASKS_PER_WORKER * workers)
+    tasks = [(size,) + prefix for prefix in prefixes]
+    total = 0
+    with Pool(workers) as pool:
+        for pid, count, seconds in pool.imap_unordered(run_prefix_task, tasks):
+            total += count
+            if report is not None:
+                load = report.setdefault(pid, [0, 0.0])
+                load[0] += 1
+                load[1] += seconds
+    return total
+
+# Min-conflicts local search: one valid placement for very large N (10^6 and beyond)
+# The placement is a permutation - queens[r] is the column of the queen in row r - so rows and
+# columns can never clash and only diagonals need repairing. Diagonal occupancy lives in two flat
+# counter arrays, so moving a queen and pricing a move are O(1) and memory stays O(N).
+# Conflicts are counted as attacking pairs: a diagonal holding k queens contributes k*(k-1)/2.
+
+GREEDY_TRIES = 32  # Unused columns tried per row during the greedy start
+SWAP_TRIES = 64  # Random partners tried per conflicted queen before giving up on it for now
+STALL_LIMIT = 100  # Repair steps without improvement before a restart
+
+# Greedy start: each row takes the first of a few random unused columns whose diagonals are empty
+# Almost every row finds one, so only a handful of conflicts is left for the repair phase.
+def greedy_placement(size, rng, queens, down, up):
+    unused = list(range(size))
+    rng.shuffle(unused)  # The tail of the list is a random sample of the unused columns
+    for row in range(size):
+        last = len(unused) - 1
+        pick = last
+        for k in range(last, max(last - GREEDY_TRIES, -1), -1):
+            col = unused[k]
+            if not down[row + col] and not up[row - col + size - 1]:
+                pick = k
+                break
+        col = unused[pick]
+        unused[pick] = unused[last]
+        unused.pop()
+        queens[row] = col
+        down[row + col] += 1
+        up[row - col + size - 1] += 1
+
+# Swap the columns of rows i and j, updating the counters; returns the change in conflicting pairs
+def swap_queens(size, queens, down, up, i, j):
+    a, b = queens[i], queens[j]
+    delta = 2 - down[i + a] - up[i - a + size - 1]  # Lift the queen at (i, a)
+    down[i + a] -= 1
+    up[i - a + size - 1] -= 1
+    delta += 2 - down[j + b] - up[j - b + size - 1]  # Lift the queen at (j, b)
+    down[j + b] -= 1
+    up[j - b + size - 1] -= 1
+    delta += down[i + b] + up[i - b + size - 1]  # Drop one at (i, b)
+    down[i + b] += 1
+    up[i - b + size - 1] += 1
+    delta += down[j + a] + up[j - a + size - 1]  # Drop one at (j, a)
+    down[j + a] += 1
+    up[j - a + size - 1] += 1
+    queens[i], queens[j] = b, a
+    return delta
+
+def attacked(size, queens, down, up, row):
+    col = queens[row]
+    return down[row + col] > 1 or up[row - col + size - 1] > 1
+
+# Find one solution; returns queens as an array of columns per row, or None if max_restarts run out
+def solve_min_conflicts(size, seed=None, max_restarts=100):
+    if size in (2, 3):
+        return None  # No solution exists
+    if size == 0:
+        return array('i')
+    rng = random.Random(seed)
+    for _ in range(max_restarts + 1):
+        queens = array('i', [0]) * size
+        down = array('i', [0]) * (2 * size - 1)  # Queens per row+col diagonal
+        up = array('i', [0]) * (2 * size - 1)  # Queens per row-col diagonal
+        greedy_placement(size, rng, queens, down, up)
+        conflicts = sum(k * (k - 1) // 2 for k in down if k > 1) + sum(k * (k - 1) // 2 for k in up if k > 1)
+        pending = [row for row in range(size) if attacked(size, queens, down, up, row)]
+        stalled = 0
+        while conflicts and stalled < STALL_LIMIT:
+            row = pending[-1] if pending else rng.randrange(size)
+            if pending and not attacked(size, queens, down, up, row):
+                pending.pop()  # Fixed as a side effect of an earlier swap
+                continue
+            sideways = None
+            for _ in range(SWAP_TRIES):
+                other = rng.randrange(size)
+                delta = swap_queens(size, queens, down, up, row, other)
+                if delta < 0:
+                    conflicts += delta
+                    stalled = 0
+                    if attacked(size, queens, down, up, other):
+                        pending.append(other)
+                    break
+                swap_queens(size, queens, down, up, row, other)  # Undo
+                if delta == 0:
+                    sideways = other
+            else:
+                stalled += 1
+                if sideways is not None:  # No improving swap: take a sideways one to walk across the plateau
+                    swap_queens(size, queens, down, up, row, sideways)
+                    if attacked(size, queens, down, up, sideways):
+                        pending.append(sideways)
+                elif pending:  # Retry this queen later, after others have moved
+                    pending.insert(0, pending.pop())
+        if not conflicts:
+            return queens
+    return None
+
+# Check a placement in O(N): every column and both diagonals used at most once
+def is_valid_placement(queens):
+    size = len(queens)
+    return (len(set(queens)) == size and len({r + c for r, c in enumerate(queens)}) == size
+            and len({r - c for r, c in enumerate(queens)}) == size)
+
+def bitboard():
+    size = int(input("Enter size of chessboard: "))
+    start_time = time.time()
+    print(f"\nTotal Solutions: {count_bitboard(size)}")
+    print(f"Time Taken: {time.time() - start_time:.4f} seconds")
+
+def parallel():
+    size = int(input("Enter size of chessboard: "))
+    workers = int(input("Enter number of workers (0 for all cores): ")) or None
+    report = {}
+    start_time = time.time()
+    total = count_parallel(size, workers, report=report)
+    print(f"\nTotal Solutions: {total}")
+    print(f"Time Taken: {time.time() - start_time:.4f} seconds")
+    busy = [seconds for tasks, seconds in report.values()]
+    for pid, (tasks, seconds) in sorted(report.items()):
+        print(f"Worker {pid}: {tasks} tasks, {seconds:.4f} seconds busy")
+    if busy and sum(busy):
+        # 1.0 means every worker was busy for the same time
+        print(f"Load balance (max / mean busy time): {max(busy) / (sum(busy) / len(busy)):.2f}")
+
+def local_search():
+    size = int(input("Enter size of chessboard: "))
+    start_time = time.time()
+    queens = solve_min_conflicts(size)
+    if queens is None:
+        print("\nNo solution found")
+        return
+    print(f"\nSolution found (valid: {is_valid_placement(queens)})")
+    print("Columns of the first rows:", list(queens[:20]))
+    print(f"Time Taken: {time.time() - start_time:.4f} seconds")
+
 def main():
     print("1. Branch and Bound")
     print("2. Backtracking")
+    print("3. Bitboard (count only, fast)")
+    print("4. Bitboard, parallel over worker processes (count only)")
+    print("5. Min-conflicts local search (one solution, very large N)")
     choice = int(input("Enter your choice: "))
     if choice == 1:
         branch()
     elif choice == 2:
         back()
+    elif choice == 3:
+        bitboard()
+    elif choice == 4:
+        parallel()
+    elif choice == 5:
+        local_search()
     else:
         print("Invalid choice!")
-main()
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,16 @@
 ''' Implement Greedy Search Algorithm for Minimum Spanning Tree (MST). '''
 
+import bisect  # Row offsets of the sorted adjacency
+import heapq  # k-way merge of sorted runs
+import itertools  # Chunked reading and flattening of records
+import operator  # C-level helpers for mapping over arrays
+import os  # Paths of the temporary run files
+import random  # Pivot sampling for Filter-Kruskal
+import sys  # Optional edge file on the command line
+import tempfile  # Scratch directory for sorted runs
+from array import array  # Compact typed arrays for the large-graph engine
+from multiprocessing import Pool, shared_memory  # Worker pool and shared edge arrays for Boruvka
+
 # Class to represent an Edge in the Undirected Graph
 # This class stores information about an edge, including the two vertices it connects (u and v) and its weight.
 class Edge:
@@ -74,11 +85,709 @@ def kruskal_mst(vertices, edges):
 
 #<------------------------------------------------------------------------------  
 
+# Array-backed engine for large graphs
+# kruskal_mst above builds one Edge object per edge, sorts them with a Python lambda and uses a
+# recursive find_parent that can hit the recursion limit on long chains. The engine below keeps the
+# edges as three parallel typed arrays (u, v, weight), sorts edge indices by weight, and runs an
+# iterative union-find with path halving over array-backed parent and rank storage.
+
+# Edges stored as parallel arrays instead of Edge objects (8 bytes per endpoint and per weight)
+class EdgeList:
+    def __init__(self, weight_type='q'):
+        self.u = array('q')  # First vertex of every edge
+        self.v = array('q')  # Second vertex of every edge
+        self.weight = array(weight_type)  # Weight of every edge ('q' for integers, 'd' for floats)
+
+    def add(self, u, v, weight):
+        self.u.append(u)
+        self.v.append(v)
+        self.weight.append(weight)
+
+    # Build an EdgeList from a list of Edge objects
+    @classmethod
+    def from_edges(cls, edges, weight_type='q'):
+        edge_list = cls(weight_type)
+        edge_list.u.extend(edge.u for edge in edges)
+        edge_list.v.extend(edge.v for edge in edges)
+        edge_list.weight.extend(edge.weight for edge in edges)
+        return edge_list
+
+    def __len__(self):
+        return len(self.u)
+
+    # Edge indices in ascending weight order (stable, so equal weights keep their input order)
+    def sorted_indices(self):
+        return sorted(range(len(self.u)), key=self.weight.__getitem__)  # C-level key, no lambda
+
+#<------------------------------------------------------------------------------  
+
+# Find the root of node's set without recursion, halving the path on the way
+# Every visited node is pointed at its grandparent, which flattens the tree as much as full path
+# compression over repeated calls while needing only one pass and no stack.
+def find_root(parent, node):
+    while parent[node] != node:
+        parent[node] = parent[parent[node]]
+        node = parent[node]
+    return node
+
+# Join two roots using union by rank (both arguments must already be roots)
+def union_roots(parent, rank, root_u, root_v):
+    if rank[root_u] < rank[root_v]:
+        parent[root_u] = root_v
+    elif rank[root_u] > rank[root_v]:
+        parent[root_v] = root_u
+    else:
+        parent[root_v] = root_u
+        rank[root_u] += 1
+
+# Fresh union-find storage for the given number of vertices
+def make_sets(vertices):
+    parent = array('q', range(vertices))  # Every node starts as its own root
+    rank = bytearray(vertices)  # Ranks stay below log2(vertices), so one byte is enough
+    return parent, rank
+
+#<------------------------------------------------------------------------------  
+
+# Kruskal's algorithm over an EdgeList
+# Returns (indices of the MST edges in the order they were accepted, total weight); no per-edge
+# objects are created and each edge costs two root lookups. order may supply the ascending edge
+# order when the caller already has it.
+def kruskal_arrays(vertices, edges, order=None):
+    parent, rank = make_sets(vertices)
+    u, v, weight = edges.u, edges.v, edges.weight
+    selected = array('q')  # Indices of the accepted edges
+    total = 0
+
+    for i in (edges.sorted_indices() if order is None else order):  # Edges in ascending weight order
+        root_u = find_root(parent, u[i])
+        root_v = find_root(parent, v[i])
+        if root_u != root_v:  # Different sets, so the edge does not form a cycle
+            union_roots(parent, rank, root_u, root_v)
+            selected.append(i)
+            total += weight[i]
+            if len(selected) == vertices - 1:  # The MST is complete
+                break
+
+    return selected, total
+
+#<------------------------------------------------------------------------------  
+
+# External-memory (streaming) Kruskal for edge files larger than RAM
+# The edge file (one "u v weight" line per edge, integers) is read in chunks; each chunk is sorted
+# by weight and written to a temporary binary run file. The runs are then k-way merged straight into
+# the union-find loop, which stops as soon as vertices - 1 edges are accepted. Memory is O(V + chunk)
+# rather than O(E).
+
+RUN_BLOCK = 65536  # Edges read back from a run file at a time during the merge
+
+# Sort one chunk of edges by weight and write it as interleaved (weight, u, v) int64 records
+def write_run(directory, number, u, v, weight):
+    records = sorted(zip(weight, u, v))  # Tuple sort runs in C; ties are ordered by (u, v)
+    path = os.path.join(directory, f"run{number}.bin")
+    with open(path, 'wb') as f:
+        array('q', itertools.chain.from_iterable(records)).tofile(f)
+    return path
+
+# Stream the (weight, u, v) records of one run file back in blocks
+def read_run(path):
+    with open(path, 'rb') as f:
+        while True:
+            block = array('q', f.read(3 * 8 * RUN_BLOCK))
+            if not block:
+                return
+            yield from zip(block[0::3], block[1::3], block[2::3])
+
+# Split the edge file into sorted runs; returns (run paths, number of vertices seen)
+def make_runs(path, directory, chunk_edges):
+    runs = []
+    highest = -1
+    with open(path, 'rb') as f:
+        while True:
+            lines = list(itertools.islice(f, chunk_edges))
+            if not lines:
+                break
+            numbers = array('q', map(int, b' '.join(lines).split()))  # Parse the whole chunk at once
+            u, v, weight = numbers[0::3], numbers[1::3], numbers[2::3]
+            highest = max(highest, max(u), max(v))
+            runs.append(write_run(directory, len(runs), u, v, weight))
+    return runs, highest + 1
+
+# Kruskal over an edge file with bounded memory; returns (EdgeList of the MST edges, total weight)
+# vertices defaults to one more than the largest vertex number found in the file.
+def kruskal_external(path, vertices=None, chunk_edges=1000000):
+    with tempfile.TemporaryDirectory() as directory:
+        runs, seen = make_runs(path, directory, chunk_edges)
+        vertices = seen if vertices is None else vertices
+        parent, rank = make_sets(vertices)
+        mst = EdgeList()
+        total = 0
+        for weight, u, v in heapq.merge(*(read_run(run) for run in runs)):  # Globally sorted edges
+            if len(mst) >= vertices - 1:  # The MST is complete; the rest of the file is never read
+                break
+            root_u = find_root(parent, u)
+            root_v = find_root(parent, v)
+            if root_u != root_v:
+                union_roots(parent, rank, root_u, root_v)
+                mst.add(u, v, weight)
+                total += weight
+    return mst, total
+
+#<------------------------------------------------------------------------------  
+
+# Prim's algorithm for dense graphs
+# Kruskal sorts every edge, which is wasteful when E approaches V^2. Prim grows the tree from a vertex
+# and only needs the cheapest known edge into every vertex: with an indexed heap and decrease-key
+# that is O(E log V), and with a plain array scan it is O(V^2), the best choice for near-complete graphs.
+
+# Compressed adjacency built from an EdgeList: the incident edges of vertex x are
+# targets[offsets[x]:offsets[x + 1]] and the matching edge indices are edge_ids[...]
+# Both edge directions are sorted by their source vertex with a C-level key, so the only Python
+# loop is over the vertices.
+def build_adjacency(vertices, edges):
+    count = len(edges)
+    sources = edges.u + edges.v  # Every edge once in each direction
+    ends = edges.v + edges.u
+    order = sorted(range(2 * count), key=sources.__getitem__)
+    targets = array('q', list(map(ends.__getitem__, order)))  # Lists first: array() from an iterator is slow
+    edge_ids = array('q', list(map(operator.mod, order, itertools.repeat(count or 1))))
+    sorted_sources = list(map(sources.__getitem__, order))
+    offsets = array('q', (bisect.bisect_left(sorted_sources, x) for x in range(vertices + 1)))
+    return offsets, targets, edge_ids
+
+# Binary min-heap over vertex ids with a position index, so a key can be decreased in O(log V)
+class IndexedHeap:
+    def __init__(self, vertices):
+        self.heap = array('q')  # Vertex ids in heap order
+        self.pos = array('q', [-1]) * vertices  # Heap slot of every vertex, -1 when not in the heap
+        self.key = [0] * vertices  # Current key of every vertex in the heap
+
+    def __len__(self):
+        return len(self.heap)
+
+    # Insert vertex with key, or lower its key if it is already in the heap with a larger one
+    def push_or_decrease(self, vertex, key):
+        if self.pos[vertex] < 0:
+            self.heap.append(vertex)
+            self.pos[vertex] = len(self.heap) - 1
+        elif key >= self.key[vertex]:
+            return
+        self.key[vertex] = key
+        self.sift_up(self.pos[vertex])
+
+    def pop(self):
+        heap, pos = self.heap, self.pos
+        top = heap[0]
+        last = heap.pop()
+        pos[top] = -1
+        if heap:
+            heap[0] = last
+            pos[last] = 0
+            self.sift_down(0)
+        return top
+
+    def sift_up(self, slot):
+        heap, pos, key = self.heap, self.pos, self.key
+        vertex = heap[slot]
+        while slot > 0:
+            parent = (slot - 1) >> 1
+            if key[heap[parent]] <= key[vertex]:
+                break
+            heap[slot] = heap[parent]
+            pos[heap[slot]] = slot
+            slot = parent
+        heap[slot] = vertex
+        pos[vertex] = slot
+
+    def sift_down(self, slot):
+        heap, pos, key = self.heap, self.pos, self.key
+        size = len(heap)
+        vertex = heap[slot]
+        while True:
+            child = 2 * slot + 1
+            if child >= size:
+                break
+            if child + 1 < size and key[heap[child + 1]] < key[heap[child]]:
+                child += 1
+            if key[vertex] <= key[heap[child]]:
+                break
+            heap[slot] = heap[child]
+            pos[heap[slot]] = slot
+            slot = child
+        heap[slot] = vertex
+        pos[vertex] = slot
+
+# Prim with an indexed heap; grows a tree from every unvisited vertex, so disconnected graphs give
+# a minimum spanning forest like Kruskal. Returns (MST edge indices, total weight).
+def prim_heap(vertices, edges, adjacency=None):
+    offsets, targets, edge_ids = adjacency or build_adjacency(vertices, edges)
+    weight = edges.weight
+    in_tree = bytearray(vertices)
+    best_edge = array('q', [-1]) * vertices  # Cheapest known edge into every vertex
+    heap = IndexedHeap(vertices)
+    selected = array('q')
+    total = 0
+    for root in range(vertices):
+        if in_tree[root]:
+            continue
+        heap.push_or_decrease(root, 0)
+        while len(heap):
+            x = heap.pop()
+            in_tree[x] = 1
+            if best_edge[x] >= 0:
+                selected.append(best_edge[x])
+                total += weight[best_edge[x]]
+            for slot in range(offsets[x], offsets[x + 1]):
+                y, i = targets[slot], edge_ids[slot]
+                if not in_tree[y] and (best_edge[y] < 0 or weight[i] < weight[best_edge[y]]):
+                    best_edge[y] = i
+                    heap.push_or_decrease(y, weight[i])
+    return selected, total
+
+# Prim with a linear scan for the next vertex: O(V^2 + E) and no heap at all, for near-complete graphs
+# The scan is one C-level min() over a plain key list; vertices already in the tree get a key of
+# infinity so they are never picked again.
+def prim_dense(vertices, edges, adjacency=None):
+    offsets, targets, edge_ids = adjacency or build_adjacency(vertices, edges)
+    weight = edges.weight
+    infinity = float('inf')
+    key = [infinity] * vertices  # Cheapest known edge weight into every outside vertex
+    in_tree = bytearray(vertices)
+    best_edge = array('q', [-1]) * vertices
+    selected = array('q')
+    total = 0
+    order = range(vertices)
+    for _ in range(vertices):
+        x = min(order, key=key.__getitem__)
+        if key[x] == infinity:  # Nothing reachable is left: start a new tree at the first outside vertex
+            x = in_tree.index(0)
+        else:
+            selected.append(best_edge[x])
+            total += weight[best_edge[x]]
+        in_tree[x] = 1
+        key[x] = infinity
+        for slot in range(offsets[x], offsets[x + 1]):
+            y, i = targets[slot], edge_ids[slot]
+            if not in_tree[y] and weight[i] < key[y]:
+                key[y] = weight[i]
+                best_edge[y] = i
+    return selected, total
+
+#<------------------------------------------------------------------------------  
+
+# Parallel Boruvka
+# Kruskal walks one sorted list, so only one core can work on it. Boruvka instead repeats rounds:
+# every component picks its cheapest outgoing edge, and all picked edges are added at once, which at
+# least halves the number of components per round (O(log V) rounds). The edge arrays and the current
+# component label of every vertex live in shared memory; each worker scans one slice of the edges and
+# reports the cheapest outgoing edge it saw per component. Ties are broken by edge index, i.e. edges
+# are compared as (weight, index), which is exactly the order a stable Kruskal sort uses, so both
+# backends select the same edges and the same total weight.
+
+boruvka_edges = None  # (u, v, weight) views of the shared edge arrays, set up in every worker
+boruvka_labels = None  # int64 view of the shared component label of every vertex
+boruvka_memory = []  # The worker's handles on the shared blocks (kept alive with the views)
+
+# Pool initializer: attach to the shared edge arrays and component labels
+# weight_type is the array typecode of the weights ('q', 'd', ...), so float weights work too.
+def init_boruvka_worker(names, edge_count, vertices, weight_type='q'):
+    global boruvka_edges, boruvka_labels
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    boruvka_memory.extend(blocks)
+    weight_size = array(weight_type).itemsize
+    boruvka_edges = (blocks[0].buf[:8 * edge_count].cast('q'), blocks[1].buf[:8 * edge_count].cast('q'),
+                     blocks[2].buf[:weight_size * edge_count].cast(weight_type))
+    boruvka_labels = blocks[3].buf[:8 * vertices].cast('q')
+
+# Worker task: cheapest outgoing edge per component within edges[low:high] as {component: (weight, index)}
+def cheapest_edges(bounds):
+    low, high = bounds
+    u, v, weight = boruvka_edges
+    label = boruvka_labels
+    best = {}
+    missing = (float('inf'), -1)  # Loses against every real (weight, index) pair
+    for i in range(low, high):
+        a, b = label[u[i]], label[v[i]]
+        if a == b:
+            continue  # Both ends are already in the same component
+        candidate = (weight[i], i)
+        if candidate < best.get(a, missing):
+            best[a] = candidate
+        if candidate < best.get(b, missing):
+            best[b] = candidate
+    return best
+
+# Copy an array into a new shared memory block
+def share_array(values):
+    length = values.itemsize * len(values)
+    block = shared_memory.SharedMemory(create=True, size=max(8, length))
+    block.buf[:length] = values.tobytes()
+    return block
+
+# Boruvka over a process pool; returns (MST edge indices, total weight) like kruskal_arrays
+def boruvka_parallel(vertices, edges, workers=None, partitions=None):
+    edge_count = len(edges)
+    workers = workers or os.cpu_count()
+    partitions = partitions or 4 * workers  # Several slices per worker keep the pool evenly loaded
+    step = max(1, -(-edge_count // partitions))
+    slices = [(low, min(edge_count, low + step)) for low in range(0, edge_count, step)]
+
+    labels = array('q', range(vertices))  # Component (root vertex) of every vertex
+    parent, rank = make_sets(vertices)
+    selected = array('q')
+    total = 0
+    weight_type = edges.weight.typecode
+    blocks = []  # Filled inside the try, so blocks made before a failure are still unlinked
+    shared_labels = None
+    try:
+        for column in (array('q', edges.u), array('q', edges.v), edges.weight, labels):
+            blocks.append(share_array(column))
+        shared_labels = blocks[3].buf[:8 * vertices].cast('q')
+        with Pool(workers, initializer=init_boruvka_worker,
+                  initargs=([block.name for block in blocks], edge_count, vertices, weight_type)) as pool:
+            while True:
+                # Merge the per-slice answers into the cheapest outgoing edge of every component
+                best = {}
+                for found in pool.imap_unordered(cheapest_edges, slices):
+                    for component, candidate in found.items():
+                        if component not in best or candidate < best[component]:
+                            best[component] = candidate
+                if not best:
+                    break  # No component has an outgoing edge: the forest is complete
+
+                # Contract: add every picked edge (each may be picked by both of its components)
+                for weight, i in sorted(set(best.values()), key=lambda pick: pick[1]):
+                    root_u = find_root(parent, edges.u[i])
+                    root_v = find_root(parent, edges.v[i])
+                    if root_u != root_v:
+                        union_roots(parent, rank, root_u, root_v)
+                        selected.append(i)
+                        total += weight
+                for x in range(vertices):
+                    labels[x] = find_root(parent, x)
+                shared_labels[:] = labels  # Publish the new labels for the next round
+    finally:
+        if shared_labels is not None:
+            shared_labels.release()
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return selected, total
+
+#<------------------------------------------------------------------------------  
+
+# Dynamic MST under edge insertions and weight decreases
+# Adding an edge (u, v, w) to a spanning forest closes at most one cycle: the tree path from u to v
+# plus the new edge. The MST stays minimal if the heaviest edge on that cycle is dropped, so each
+# update only needs a "maximum edge on the tree path" query. A link-cut tree answers it, and links
+# or cuts edges, in O(log V) amortised time. Every tree edge is its own node between its two
+# endpoint vertices, so the path maximum is the maximum over edge nodes. Lowering the weight of a
+# tree edge keeps the tree optimal; lowering a non-tree edge is handled like inserting it again.
+
+class DynamicMST:
+    # Seed with the graph and its current MST (edge indices, e.g. from kruskal_arrays)
+    def __init__(self, vertices, edges=None, selected=()):
+        self.vertices = vertices
+        self.edges = EdgeList() if edges is None else edges  # Every edge ever seen, tree or not (extended in place)
+        self.in_tree = set()  # Indices of the edges currently in the MST
+        self.total = 0  # Total weight of the MST, kept up to date so reading it is O(1)
+        # Link-cut tree storage: nodes 0..V-1 are vertices, node V + i is edge i
+        size = vertices + len(self.edges)
+        self.left, self.right, self.parent = [-1] * size, [-1] * size, [-1] * size
+        self.flip = bytearray(size)  # Pending reversal of a splay subtree (from make_root)
+        self.top = list(range(size))  # Heaviest node in every splay subtree
+        for i in selected:
+            self.link_edge(i)
+
+    @property
+    def total_weight(self):
+        return self.total
+
+    # Ordering key of a node: vertices lose against every edge; equal weights are ordered by index
+    def key(self, node):
+        if node < self.vertices:
+            return (float('-inf'), -1)
+        i = node - self.vertices
+        return (self.edges.weight[i], i)
+
+    # Splay tree helpers
+    def is_root(self, x):
+        p = self.parent[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+    def push(self, x):
+        if self.flip[x]:
+            left, right = self.left[x], self.right[x]
+            self.left[x], self.right[x] = right, left
+            for child in (left, right):
+                if child != -1:
+                    self.flip[child] ^= 1
+            self.flip[x] = 0
+
+    def update(self, x):
+        best = x
+        for child in (self.left[x], self.right[x]):
+            if child != -1 and self.key(self.top[child]) > self.key(best):
+                best = self.top[child]
+        self.top[x] = best
+
+    def rotate(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        p_was_root = self.is_root(p)
+        if left[p] == x:
+            moved = right[x]
+            left[p], right[x] = moved, p
+        else:
+            moved = left[x]
+            right[p], left[x] = moved, p
+        if moved != -1:
+            parent[moved] = p
+        if not p_was_root:
+            if left[g] == p:
+                left[g] = x
+            else:
+                right[g] = x
+        parent[x], parent[p] = g, x
+        self.update(p)
+        self.update(x)
+
+    def splay(self, x):
+        path = [x]  # Push pending reversals from the splay root down to x first
+        while not self.is_root(path[-1]):
+            path.append(self.parent[path[-1]])
+        for y in reversed(path):
+            self.push(y)
+        while not self.is_root(x):
+            p = self.parent[x]
+            if not self.is_root(p):
+                g = self.parent[p]
+                self.rotate(p if (self.left[g] == p) == (self.left[p] == x) else x)
+            self.rotate(x)
+
+    # Link-cut tree operations
+    def access(self, x):
+        last, y = -1, x
+        while y != -1:
+            self.splay(y)
+            self.right[y] = last
+            self.update(y)
+            last, y = y, self.parent[y]
+        self.splay(x)
+
+    def make_root(self, x):
+        self.access(x)
+        self.flip[x] ^= 1
+        self.push(x)
+
+    def tree_root(self, x):
+        self.access(x)
+        while True:
+            self.push(x)
+            if self.left[x] == -1:
+                break
+            x = self.left[x]
+        self.splay(x)
+        return x
+
+    def link(self, x, y):
+        self.make_root(x)
+        self.parent[x] = y
+
+    def cut(self, x, y):
+        self.make_root(x)
+        self.access(y)
+        self.left[y] = self.parent[x] = -1  # x is y's only left node after access
+        self.update(y)
+
+    # Heaviest edge on the tree path between vertices a and b, or None when they are not connected
+    def path_max(self, a, b):
+        if self.tree_root(a) != self.tree_root(b):
+            return None
+        self.make_root(a)
+        self.access(b)
+        return self.top[b] - self.vertices
+
+    def link_edge(self, i):
+        node = self.vertices + i
+        self.link(self.edges.u[i], node)
+        self.link(node, self.edges.v[i])
+        self.in_tree.add(i)
+        self.total += self.edges.weight[i]
+
+    def cut_edge(self, i):
+        node = self.vertices + i
+        self.cut(self.edges.u[i], node)
+        self.cut(node, self.edges.v[i])
+        self.in_tree.discard(i)
+        self.total -= self.edges.weight[i]
+
+    # Offer edge i to the tree: link it if it joins two trees, or swap it for a heavier cycle edge
+    def offer(self, i):
+        u, v = self.edges.u[i], self.edges.v[i]
+        if u == v:
+            return
+        heaviest = self.path_max(u, v)
+        if heaviest is None:
+            self.link_edge(i)
+        elif self.key(self.vertices + heaviest) > self.key(self.vertices + i):
+            self.cut_edge(heaviest)
+            self.link_edge(i)
+
+    # Add a new edge; returns its index
+    def insert_edge(self, u, v, weight):
+        self.edges.add(u, v, weight)
+        for storage in (self.left, self.right, self.parent):
+            storage.append(-1)
+        self.flip.append(0)
+        self.top.append(len(self.top))
+        i = len(self.edges) - 1
+        self.offer(i)
+        return i
+
+    # Lower the weight of edge i
+    def decrease_weight(self, i, weight):
+        if weight > self.edges.weight[i]:
+            raise ValueError("decrease_weight cannot raise a weight")
+        if i in self.in_tree:
+            self.total -= self.edges.weight[i] - weight
+            node = self.vertices + i
+            self.access(node)  # node is now the root of its splay tree, so only its own summary changes
+            self.edges.weight[i] = weight
+            self.update(node)
+        else:
+            self.edges.weight[i] = weight
+            self.offer(i)
+
+#<------------------------------------------------------------------------------  
+
+# Filter-Kruskal
+# Most edges of a sparse-to-medium graph are never accepted, yet plain Kruskal sorts all of them.
+# Filter-Kruskal partitions the edges around a pivot weight, solves the light part first, and then
+# drops every heavy edge whose endpoints are already connected before sorting what is left. Small
+# parts are sorted and scanned like ordinary Kruskal. Parts keep ascending edge-index order, so ties
+# are broken exactly as in kruskal_arrays and both select the same edges.
+
+FILTER_THRESHOLD = 4096  # Parts at most this size are sorted directly
+FILTER_RATIO = 200  # Edges per vertex above which filtering beats sorting everything in CPython
+
+# Counters for one Filter-Kruskal run, to tell whether filtering paid off
+class FilterKruskalStats:
+    def __init__(self):
+        self.sorted_edges = 0  # Edges that reached a sort (base case)
+        self.filtered_edges = 0  # Heavy edges dropped because their endpoints were already connected
+        self.partitions = 0  # Pivot partitions performed
+
+    def __repr__(self):
+        return (f"FilterKruskalStats(sorted={self.sorted_edges}, filtered={self.filtered_edges}, "
+                f"partitions={self.partitions})")
+
+# Returns (MST edge indices, total weight) like kruskal_arrays; pass a FilterKruskalStats to collect counters
+def filter_kruskal(vertices, edges, stats=None, threshold=FILTER_THRESHOLD):
+    stats = FilterKruskalStats() if stats is None else stats
+    u, v, weight = edges.u, edges.v, edges.weight
+    parent, rank = make_sets(vertices)
+    selected = array('q')
+    sampler = random.Random(len(edges))  # Fixed seed: pivots (and so the work done) are reproducible
+    state = {'total': 0}
+
+    # Plain Kruskal over one part whose edges are all heavier than everything handled before
+    def scan(part):
+        stats.sorted_edges += len(part)
+        for i in sorted(part, key=weight.__getitem__):
+            if len(selected) == vertices - 1:
+                return
+            root_u = find_root(parent, u[i])
+            root_v = find_root(parent, v[i])
+            if root_u != root_v:
+                union_roots(parent, rank, root_u, root_v)
+                selected.append(i)
+                state['total'] += weight[i]
+
+    def solve(part):
+        if len(selected) >= vertices - 1 or not part:
+            return
+        if len(part) <= threshold:
+            scan(part)
+            return
+        stats.partitions += 1
+        sample = sorted(weight[i] for i in sampler.sample(part, min(31, len(part))))
+        pivot = sample[len(sample) // 2]  # Median of a small sample
+        light = [i for i in part if weight[i] < pivot]
+        rest = [i for i in part if weight[i] >= pivot]
+        solve(light)
+        if len(rest) > vertices:
+            # Snapshot every vertex's root once so the filter is two list lookups per edge
+            roots = [find_root(parent, x) for x in range(vertices)]
+            kept = [i for i in rest if roots[u[i]] != roots[v[i]]]
+        else:
+            kept = [i for i in rest if find_root(parent, u[i]) != find_root(parent, v[i])]
+        stats.filtered_edges += len(rest) - len(kept)
+        scan([i for i in kept if weight[i] == pivot])  # One weight only: index order already is sorted order
+        solve([i for i in kept if weight[i] > pivot])
+
+    solve(list(range(len(edges))))
+    return selected, state['total']
+
+#<------------------------------------------------------------------------------  
+
+# Backend selection
+# minimum_spanning_tree is the entry point that replaces calling kruskal_mst directly: it takes an
+# EdgeList, picks the fastest backend for the graph's density and returns (MST edge indices, total).
+# Prim needs the adjacency, and building it from an edge list costs more than Kruskal's C-level sort,
+# so Prim is chosen only when the caller passes an adjacency it already has (see build_adjacency).
+# Then dense graphs go to heap Prim and near-complete ones to the O(V^2) array Prim; everything
+# else goes to Kruskal.
+
+DENSE_RATIO = 0.1  # Fraction of all possible edges from which heap Prim beats sorting every edge
+COMPLETE_RATIO = 0.5  # Fraction from which the O(V^2) scan beats the heap
+
+MST_BACKENDS = {
+    'kruskal': kruskal_arrays,
+    'prim': prim_heap,
+    'prim_dense': prim_dense,
+    'boruvka': boruvka_parallel,
+    'filter_kruskal': filter_kruskal,
+}
+
+# Choose a backend name from the edge density E / (V (V - 1) / 2)
+def choose_backend(vertices, edge_count, have_adjacency=False):
+    if not have_adjacency:
+        return 'filter_kruskal' if edge_count >= FILTER_RATIO * vertices else 'kruskal'
+    possible = vertices * (vertices - 1) // 2
+    density = edge_count / possible if possible else 0
+    if density >= COMPLETE_RATIO:
+        return 'prim_dense'
+    if density >= DENSE_RATIO:
+        return 'prim'
+    return 'kruskal'
+
+def minimum_spanning_tree(vertices, edges, backend='auto', adjacency=None):
+    if backend == 'auto':
+        backend = choose_backend(vertices, len(edges), adjacency is not None)
+    if backend not in MST_BACKENDS:
+        raise ValueError(f"Unknown MST backend: {backend}")
+    if backend == 'kruskal':
+        return kruskal_arrays(vertices, edges)
+    if backend in ('boruvka', 'filter_kruskal'):
+        return MST_BACKENDS[backend](vertices, edges)
+    return MST_BACKENDS[backend](vertices, edges, adjacency)
+
+#<------------------------------------------------------------------------------  
+
 # Driver Code
 # This is the main function that interacts with the user and initiates the Kruskal's algorithm to find the MST.
 def driver():
     print("\n <--- Minimum Spanning Tree (MST) using Kruskal's Algorithm --->\n")
 
+    # Streaming mode: python mst.py EDGE_FILE [VERTICES] reads "u v weight" lines from a file
+    if len(sys.argv) > 1:
+        vertices = int(sys.argv[2]) if len(sys.argv) > 2 else None
+        mst, total = kruskal_external(sys.argv[1], vertices)
+        print(f"\n Selected {len(mst)} edges from {sys.argv[1]}")
+        print("\n Total weight of MST:", total)
+        return
+
     print("\n Main Graph Details : ")
     # Ask user for number of vertices and edges in the graph
     vertices = int(input("\n Enter number of Vertices : "))